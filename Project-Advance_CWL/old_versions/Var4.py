@@ -12,11 +12,158 @@ from datetime import datetime
 import os
 import re
 import json
+import mmap
+import stat
 import csv
 import random
-from typing import List, Set, Dict, Any, Optional
+import string
+import multiprocessing
+import heapq
+import tempfile
+from contextlib import ExitStack
+from typing import List, Set, Dict, Any, Optional, Iterable, Iterator
 from collections import OrderedDict
 
+# Character class flags produced by _classify_words
+_CLASS_DIGIT, _CLASS_UPPER, _CLASS_LOWER, _CLASS_SPECIAL = 1, 2, 4, 8
+_CLASS_ALL = _CLASS_DIGIT | _CLASS_UPPER | _CLASS_LOWER | _CLASS_SPECIAL
+
+
+def _build_class_table() -> bytes:
+    """Byte translation table mapping each ASCII character to its class flag"""
+    table = bytearray(256)
+    for chars, flag in ((string.digits, _CLASS_DIGIT), (string.ascii_uppercase, _CLASS_UPPER),
+                        (string.ascii_lowercase, _CLASS_LOWER), ('!@#$%^&*', _CLASS_SPECIAL)):
+        for c in chars:
+            table[ord(c)] = flag
+    table[ord('\n')] = ord('\n')  # Keep word separators intact
+    return bytes(table)
+
+
+_CHAR_CLASS_TABLE = _build_class_table()
+
+# Special characters that put a word in the sampling "special" bucket
+_SAMPLE_SPECIALS = frozenset('!@#$%^&*')
+
+# Sampling bucket flags produced by _sample_buckets
+_BUCKET_SHORT, _BUCKET_SPECIAL, _BUCKET_LEET = 1, 2, 4
+
+# Per-length masks with a single class bit set in every byte lane
+_LANE_MASKS = {}
+
+
+def _classify_words(words: List[str], encoded: Optional[bytes] = None) -> bytes:
+    """Return one _CLASS_* flag byte per word, classifying all words in one buffer.
+    
+    Every byte is translated to its class flag in C, then each word is read as
+    one wide integer and OR-reduced SWAR-style by masking all of its byte lanes
+    at once, so there is no per-character branch.
+    """
+    if not words:
+        return b''
+    if encoded is None:
+        encoded = '\n'.join(words).encode('utf-8')
+    lanes = encoded.translate(_CHAR_CLASS_TABLE)
+    flags = bytearray()
+    append = flags.append
+    from_bytes = int.from_bytes
+    for word_lanes in lanes.split(b'\n'):
+        n = len(word_lanes)
+        masks = _LANE_MASKS.get(n)
+        if masks is None:
+            ones = from_bytes(b'\x01' * n, 'little')
+            masks = _LANE_MASKS[n] = (ones, ones << 1, ones << 2, ones << 3)
+        x = from_bytes(word_lanes, 'little')
+        append((x & masks[0] != 0)
+               | (x & masks[1] != 0) << 1
+               | (x & masks[2] != 0) << 2
+               | (x & masks[3] != 0) << 3)
+    return bytes(flags)
+
+
+def _sample_buckets(blob: str) -> bytes:
+    """Return one _BUCKET_* flag byte per word of a newline-joined chunk (Pool worker)"""
+    return bytes(
+        (len(w) <= 8)
+        | (not _SAMPLE_SPECIALS.isdisjoint(w)) << 1
+        | (any(map(str.isdigit, w)) and any(map(str.isalpha, w))) << 2
+        for w in blob.split('\n')
+    )
+
+
+def _join_chunks(words, size: int):
+    """Yield words as newline-joined blobs of up to size words (cheap to pickle)"""
+    it = iter(words)
+    while True:
+        chunk = list(itertools.islice(it, size))
+        if not chunk:
+            return
+        yield '\n'.join(chunk)
+
+
+def _sorted_batches(words: Iterator[str], size: int) -> Iterator[List[str]]:
+    """Yield sorted lists of up to size words until the iterator is exhausted"""
+    while True:
+        batch = sorted(itertools.islice(words, size))
+        if not batch:
+            return
+        yield batch
+
+
+def _merge_sorted_batches(batches: Iterable[List[str]], filename: str) -> int:
+    """Spill sorted batches to temporary runs and k-way merge them into filename"""
+    count = 0
+    with tempfile.TemporaryDirectory() as tmpdir:
+        runs = []
+        for i, batch in enumerate(batches):
+            run = os.path.join(tmpdir, f'run{i}.txt')
+            _write_chunks(run, ['\n'.join(batch).encode('utf-8'), b'\n'])
+            runs.append(run)
+            count += len(batch)
+        
+        with ExitStack() as stack:
+            files = [stack.enter_context(open(run, 'rb')) for run in runs]
+            merged = heapq.merge(*files)
+            written = 0
+            with open(filename, 'wb', buffering=1 << 20) as out:
+                # Write in chunks of 1M lines, reporting progress once per chunk
+                while True:
+                    chunk = list(itertools.islice(merged, 1000000))
+                    if not chunk:
+                        break
+                    out.writelines(chunk)
+                    written += len(chunk)
+                    print(f"  -> Saved {written:,} words...")
+    return count
+
+
+def _write_chunks(filename: str, chunks: List[bytes]):
+    """Write byte chunks to filename with as few copies and syscalls as possible.
+    
+    Regular files are sized up front and filled through a memory map. Outputs
+    that cannot be mapped (pipes, terminals, /dev/stdout) get the same buffers
+    through a handful of large os.write calls instead.
+    """
+    total = sum(len(chunk) for chunk in chunks)
+    fd = os.open(filename, os.O_RDWR | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+    try:
+        if total and stat.S_ISREG(os.fstat(fd).st_mode):
+            os.ftruncate(fd, total)
+            with mmap.mmap(fd, total, access=mmap.ACCESS_WRITE) as mm:
+                offset = 0
+                for chunk in chunks:
+                    mm[offset:offset + len(chunk)] = chunk
+                    offset += len(chunk)
+                mm.flush()
+        else:
+            for chunk in chunks:
+                view = memoryview(chunk)
+                while view:
+                    view = view[os.write(fd, view[:1 << 30]):]
+    finally:
+        os.close(fd)
+
+
 class MegaWordlistGenerator:
     def __init__(self):
         self.total_generated = 0
@@ -702,55 +849,83 @@ class MegaWordlistGenerator:
         
         return filtered
     
-    def save_wordlist(self, wordlist: Set, filename: str, max_words: int = 10000000):
-        """Save wordlist with progress and statistics"""
-        wordlist_list = list(wordlist)
-        
-        if len(wordlist_list) > max_words:
-            print(f"[!] Wordlist too large ({len(wordlist_list):,}), sampling to {max_words:,}")
+    def save_wordlist(self, wordlist: Iterable[str], filename: str, max_words: int = 10000000,
+                      batch_size: int = 1000000):
+        """Save wordlist with progress and statistics (streams any iterable of words)"""
+        if hasattr(wordlist, '__len__') and len(wordlist) > max_words:
+            print(f"[!] Wordlist too large ({len(wordlist):,}), sampling to {max_words:,}")
             
-            # Intelligent sampling
+            # Intelligent sampling (bucket passes read the set directly, no list copy)
             sampled = set()
             
+            # Classify every word on all cores, one bucket flag byte per word
+            with multiprocessing.Pool() as pool:
+                flags = b''.join(pool.imap(_sample_buckets, _join_chunks(wordlist, 100000)))
+            
             # Keep all short passwords (more likely)
-            short = [w for w in wordlist_list if len(w) <= 8]
-            sampled.update(short[:100000])
+            short = [w for w, f in zip(wordlist, flags) if f & _BUCKET_SHORT][:100000]
+            sampled.update(short)
             
             # Keep all with special chars
-            special = [w for w in wordlist_list if any(c in '!@#$%^&*' for c in w)]
-            sampled.update(special[:200000])
+            special = [w for w, f in zip(wordlist, flags) if f & _BUCKET_SPECIAL][:200000]
+            sampled.update(special)
             
             # Keep all leet passwords
-            leet = [w for w in wordlist_list if any(c.isdigit() for c in w) and any(c.isalpha() for c in w)]
-            sampled.update(leet[:300000])
+            leet = [w for w, f in zip(wordlist, flags) if f & _BUCKET_LEET][:300000]
+            sampled.update(leet)
+            del flags
             
-            # Random sample the rest
-            remaining = [w for w in wordlist_list if w not in sampled]
-            if len(remaining) > max_words - len(sampled):
-                import random
-                sampled.update(random.sample(remaining, max_words - len(sampled)))
+            # Random sample the rest in one streaming pass (selection sampling),
+            # so the pool of remaining words is never copied into a list
+            needed = max_words - len(sampled)
+            pool_size = len(wordlist) - len(sampled)
+            rest = []
+            if pool_size > needed:
+                for w in wordlist:
+                    if w in sampled:
+                        continue
+                    if random.random() * pool_size < needed:
+                        rest.append(w)
+                        needed -= 1
+                        if not needed:
+                            break
+                    pool_size -= 1
+            del sampled
             
-            wordlist_list = list(sampled)
-        
-        # Sort
-        wordlist_list.sort()
-        
-        # Save
-        print(f"[*] Saving {len(wordlist_list):,} words to {filename}...")
+            # Sort each bucket on its own and merge them; a word kept by several
+            # buckets ends up adjacent in the merge and is emitted once. The
+            # batch sort below then only has to confirm one already-sorted run.
+            for bucket in (short, special, leet, rest):
+                bucket.sort()
+            wordlist = (w for w, _ in itertools.groupby(heapq.merge(short, special, leet, rest)))
+        
+        # Sort in batches: if everything fits in one batch it is written from
+        # memory, otherwise batches become sorted runs on disk that are merged,
+        # so memory stays bounded by batch_size instead of the wordlist size
+        words = itertools.islice(wordlist, max_words)
+        wordlist_list = sorted(itertools.islice(words, batch_size))
+        overflow = sorted(itertools.islice(words, batch_size))
+        encoded = None
         
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                for i, word in enumerate(wordlist_list):
-                    f.write(word + '\n')
-                    if i % 1000000 == 0 and i > 0:
-                        print(f"  -> Saved {i:,} words...")
+            if overflow:
+                print(f"[*] Saving to {filename} via sorted runs of {batch_size:,} words...")
+                batches = itertools.chain((wordlist_list, overflow), _sorted_batches(words, batch_size))
+                saved = _merge_sorted_batches(batches, filename)
+            else:
+                print(f"[*] Saving {len(wordlist_list):,} words to {filename}...")
+                
+                # Encode the whole list once and blit it into the mapped file
+                encoded = '\n'.join(wordlist_list).encode('utf-8')
+                _write_chunks(filename, [encoded, b'\n'] if wordlist_list else [])
+                saved = len(wordlist_list)
             
             file_size = os.path.getsize(filename)
-            print(f"[+] Successfully saved {len(wordlist_list):,} words")
+            print(f"[+] Successfully saved {saved:,} words")
             print(f"[+] File size: {file_size:,} bytes ({file_size/1024/1024:.2f} MB)")
             
-            # Show statistics
-            self.show_statistics(wordlist_list)
+            # Show statistics (first sorted batch when the output was merged)
+            self.show_statistics(wordlist_list, encoded)
             
             return True
             
@@ -758,8 +933,8 @@ class MegaWordlistGenerator:
             print(f"[-] Error: {e}")
             return False
     
-    def show_statistics(self, wordlist):
-        """Show statistics about generated wordlist"""
+    def show_statistics(self, wordlist, encoded: Optional[bytes] = None):
+        """Show statistics about generated wordlist, reusing its encoded output buffer if given"""
         if not wordlist:
             return
         
@@ -774,16 +949,20 @@ class MegaWordlistGenerator:
             length_count[length] = length_count.get(length, 0) + 1
         
         print("\nLength distribution (sample):")
+        max_count = max(length_count.values())
         for length in sorted(length_count.keys()):
             count = length_count[length]
-            bar = '█' * int(count / max(length_count.values()) * 30)
+            bar = '█' * int(count / max_count * 30)
             print(f"  {length:2} chars: {bar} ({count})")
         
-        # Character type analysis
-        has_special = sum(1 for w in wordlist[:10000] if any(c in '!@#$%^&*' for c in w))
-        has_digits = sum(1 for w in wordlist[:10000] if any(c.isdigit() for c in w))
-        has_upper = sum(1 for w in wordlist[:10000] if any(c.isupper() for c in w))
-        has_lower = sum(1 for w in wordlist[:10000] if any(c.islower() for c in w))
+        # Character type analysis (every word is classified once, up front)
+        flags = _classify_words(wordlist, encoded)
+        has_special = has_digits = has_upper = has_lower = 0
+        for flag in flags[:10000]:
+            has_special += flag & _CLASS_SPECIAL != 0
+            has_digits += flag & _CLASS_DIGIT != 0
+            has_upper += flag & _CLASS_UPPER != 0
+            has_lower += flag & _CLASS_LOWER != 0
         
         print(f"\nCharacter types in sample:")
         print(f"  Contains special chars: {has_special/100:.1f}%")
@@ -792,11 +971,7 @@ class MegaWordlistGenerator:
         print(f"  Contains lowercase: {has_lower/100:.1f}%")
         
         # Show strongest passwords
-        strong = [w for w in wordlist if len(w) >= 12 and 
-                 any(c.isdigit() for c in w) and 
-                 any(c in '!@#$%^&*' for c in w) and
-                 any(c.isupper() for c in w) and
-                 any(c.islower() for c in w)]
+        strong = [w for w, flag in zip(wordlist, flags) if flag == _CLASS_ALL and len(w) >= 12]
         
         if strong:
             print(f"\nExamples of strong passwords generated ({len(strong)} total):")
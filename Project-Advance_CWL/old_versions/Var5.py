@@ -5,27 +5,199 @@ No auto-added words, no assumptions. User defines EVERYTHING.
 """
 
 import argparse
+import bz2
+import gzip
+import json
+import lzma
+import multiprocessing
 import sys
 from datetime import datetime
 import os
 import re
-from typing import Set, Dict, List
+import math
+import bisect
+import itertools
+from collections import Counter
+from functools import lru_cache
+from typing import Set, Dict, List, Iterable, Iterator
+
+# Runs that yield more candidates than this (see count_candidates) deduplicate
+# with a Bloom filter (~3 bytes/entry) instead of an exact set (~100 bytes/entry)
+BLOOM_THRESHOLD = 20_000_000
+
+# Runs that yield more candidates than this expand numbers and special
+# characters in worker processes
+PARALLEL_THRESHOLD = 2_000_000
+
+# Only basic leet mappings - user can customize if needed
+LEET_MAPS = {
+    'a': ['4', '@'],
+    'b': ['8', '|3'],
+    'e': ['3'],
+    'g': ['6', '9'],
+    'i': ['1', '!'],
+    'l': ['1', '|'],
+    'o': ['0'],
+    's': ['5', '$'],
+    't': ['7'],
+    'z': ['2']
+}
+
+# Date formats in the order they are tried
+DATE_FORMATS = ('%d/%m/%Y', '%m/%d/%Y', '%d-%m-%Y', '%m-%d-%Y', '%Y-%m-%d', '%d%m%Y', '%m%d%Y')
+
+# Formats keyed by the separators they contain (e.g. '//'); a date string
+# whose separators form another shape cannot match any of them
+_DATE_FORMATS_BY_SHAPE = {}
+for _fmt in DATE_FORMATS:
+    _DATE_FORMATS_BY_SHAPE.setdefault(''.join(c for c in _fmt if c in '-/'), []).append(_fmt)
+del _fmt
+_YEAR_RE = re.compile(r'(19\d{2}|20\d{2})')
+
+
+def _open_compressed(filename: str):
+    """Open a compressing binary writer chosen by file extension (None for plain text)"""
+    ext = os.path.splitext(filename)[1].lower()
+    if ext == '.gz':
+        return gzip.open(filename, 'wb', compresslevel=6)
+    if ext == '.bz2':
+        return bz2.open(filename, 'wb')
+    if ext == '.xz':
+        return lzma.open(filename, 'wb', preset=3)
+    if ext == '.zst':
+        # Optional: zstandard is only needed for .zst output
+        import zstandard
+        return zstandard.ZstdCompressor(level=3, threads=-1).stream_writer(open(filename, 'wb'))
+    return None
+
+
+# The combination and special-char stages run through emitters compiled once
+# per separator / char list, with one straight-line branch per item instead of
+# an inner loop (the lists are short and fixed for a whole run)
+@lru_cache(maxsize=16)
+def _unrolled_combinations(separators: tuple):
+    """Compile a pair emitter with one straight-line branch per separator
+    
+    separators must be sorted by length, shortest first.
+    """
+    lines = ['def emit(pairs, max_len):',
+             '    for word1, word2 in pairs:',
+             '        room = max_len - len(word1) - len(word2)']
+    for sep in separators:
+        sep_lit = repr(sep)
+        lines += [f'        if room < {len(sep)}:',
+                  '            continue',
+                  f'        yield word1 + {sep_lit} + word2' if sep else '        yield word1 + word2',
+                  f'        yield word2 + {sep_lit} + word1' if sep else '        yield word2 + word1']
+    namespace = {}
+    exec('\n'.join(lines), namespace)
+    return namespace['emit']
+
+
+@lru_cache(maxsize=16)
+def _unrolled_specials(special_chars: tuple):
+    """Compile a special-char emitter with one straight-line branch per char"""
+    lines = ['def emit(words, max_len):',
+             '    for word in words:',
+             '        room = max_len - len(word)',
+             '        if room < 0:',
+             '            continue',
+             '        yield word']
+    for char in special_chars:
+        char_lit = repr(char)
+        lines += [f'        if room >= {len(char)}:',
+                  f'            char_word = {char_lit} + word',
+                  '            yield char_word',
+                  f'            yield word + {char_lit}',
+                  f'            if room >= {2 * len(char)}:',
+                  f'                yield char_word + {char_lit}']
+    namespace = {}
+    exec('\n'.join(lines), namespace)
+    return namespace['emit']
+
+
+_EXPAND_ARGS = None  # Stage parameters, set in each worker by _init_expand_worker
+
+
+def _init_expand_worker(args: tuple):
+    """Pool initializer: receive the number/special stage parameters once"""
+    global _EXPAND_ARGS
+    _EXPAND_ARGS = args
+
+
+def _expand_chunk(blob: str) -> str:
+    """Pool worker: run the number and special-char stages over newline-joined words"""
+    numbers, specials, min_len, max_len = _EXPAND_ARGS
+    generator = CustomWordlistGenerator()
+    words = blob.split('\n')
+    if numbers is not None:
+        words = generator.add_number_patterns(words, *numbers, max_len)
+    if specials is not None:
+        words = generator.add_special_chars(words, specials, max_len)
+    # These are the last stages, so the length filter is final here; a local set
+    # drops duplicates before they are pickled back
+    return '\n'.join({word for word in words if min_len <= len(word)})
+
+
+@lru_cache(maxsize=128)
+def _parse_date(date_str: str) -> tuple:
+    """Parse a date string once, trying only formats with a matching shape"""
+    shape = ''.join(c for c in date_str if c in '-/')
+    if shape or date_str.isdigit():
+        for fmt in _DATE_FORMATS_BY_SHAPE.get(shape, ()):
+            try:
+                dt = datetime.strptime(date_str, fmt)
+            except ValueError:
+                continue
+            # User gets exactly what they input, plus basic combinations
+            return tuple({
+                dt.strftime('%d'),      # Day
+                dt.strftime('%m'),      # Month
+                dt.strftime('%Y'),      # Year
+                dt.strftime('%y'),      # Short year
+                dt.strftime('%d%m%Y'),  # DDMMYYYY
+                dt.strftime('%m%d%Y'),  # MMDDYYYY
+                dt.strftime('%Y%m%d'),  # YYYYMMDD
+            })
+    
+    # If no format matches, try to extract year
+    year_match = _YEAR_RE.search(date_str)
+    if year_match:
+        year = year_match.group(1)
+        return tuple({year, year[2:]})
+    return ()
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter for deduplicating very large word streams"""
+    
+    def __init__(self, capacity: int, error_rate: float = 1e-5):
+        self.size = max(64, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+    
+    def add(self, item: str) -> bool:
+        """Add item, returning True if it was (probably) already present"""
+        h = hash(item) & 0xFFFFFFFFFFFFFFFF
+        h1, h2 = h & 0xFFFFFFFF, (h >> 32) | 1
+        bits, size = self.bits, self.size
+        present = True
+        for i in range(self.hashes):
+            pos = (h1 + i * h2) % size
+            mask = 1 << (pos & 7)
+            if not bits[pos >> 3] & mask:
+                bits[pos >> 3] |= mask
+                present = False
+        return present
+
 
 class CustomWordlistGenerator:
+    # Strips the punctuation and spaces out of ASCII phone numbers (see get_base_words)
+    _NONDIGIT_DEL = str.maketrans('', '', ''.join(chr(c) for c in range(128) if not chr(c).isdigit()))
+    
     def __init__(self):
-        # Only basic leet mappings - user can customize if needed
-        self.leet_maps = {
-            'a': ['4', '@'],
-            'b': ['8', '|3'],
-            'e': ['3'],
-            'g': ['6', '9'],
-            'i': ['1', '!'],
-            'l': ['1', '|'],
-            'o': ['0'],
-            's': ['5', '$'],
-            't': ['7'],
-            'z': ['2']
-        }
+        # Shared module-level defaults; never mutated, custom maps replace them
+        self.leet_maps = LEET_MAPS
         
         # NO pre-defined patterns - user provides everything
     
@@ -84,6 +256,9 @@ class CustomWordlistGenerator:
             leet_custom = input("Custom leet mappings (format a=4,@ b=8, leave blank for default): ").strip()
             if leet_custom:
                 data['custom_leet'] = self.parse_custom_leet(leet_custom)
+            
+            exhaustive_choice = input("Exhaustive leet (every mix of substitutions)? (y/n): ").strip().lower()
+            data['leet_exhaustive'] = exhaustive_choice == 'y'
         
         # Number addition options
         num_choice = input("Add number patterns? (y/n): ").strip().lower()
@@ -120,6 +295,17 @@ class CustomWordlistGenerator:
         
         return {k: v for k, v in data.items() if v is not None and v != []}
     
+    def load_config(self, config_file) -> Dict:
+        """Load generation parameters from a JSON config instead of prompting"""
+        data = json.load(config_file)
+        
+        # Number range is given as inclusive [start, end], like the 0-99 prompt
+        if 'number_range' in data:
+            start, end = data['number_range']
+            data['number_range'] = list(range(start, end + 1))
+        
+        return data
+    
     def parse_custom_leet(self, leet_str: str) -> Dict:
         """Parse custom leet mappings from user input"""
         custom_leet = {}
@@ -132,41 +318,10 @@ class CustomWordlistGenerator:
     
     def parse_date_components(self, date_str: str) -> List[str]:
         """Extract date components based on user input"""
-        components = []
-        
         if not date_str:
-            return components
-        
-        # Try common formats
-        formats = ['%d/%m/%Y', '%m/%d/%Y', '%d-%m-%Y', '%m-%d-%Y', '%Y-%m-%d', '%d%m%Y', '%m%d%Y']
+            return []
         
-        for fmt in formats:
-            try:
-                dt = datetime.strptime(date_str, fmt)
-                # User gets exactly what they input, no extra combinations
-                components = [
-                    dt.strftime('%d'),      # Day
-                    dt.strftime('%m'),      # Month
-                    dt.strftime('%Y'),      # Year
-                    dt.strftime('%y'),      # Short year
-                ]
-                # Also add basic combinations if user wants
-                components.append(dt.strftime('%d%m%Y'))  # DDMMYYYY
-                components.append(dt.strftime('%m%d%Y'))  # MMDDYYYY
-                components.append(dt.strftime('%Y%m%d'))  # YYYYMMDD
-                break
-            except ValueError:
-                continue
-        
-        # If no format matches, try to extract year
-        if not components:
-            year_match = re.search(r'(19\d{2}|20\d{2})', date_str)
-            if year_match:
-                year = year_match.group(1)
-                components.append(year)
-                components.append(year[2:])
-        
-        return list(set([c for c in components if c]))
+        return list(_parse_date(date_str))
     
     def get_base_words(self, data: Dict) -> Set:
         """Get ONLY the words user provided - no extras"""
@@ -193,8 +348,12 @@ class CustomWordlistGenerator:
                 words.add(keyword.title())
         
         # Numbers (exactly as user provided)
-        if 'phone' in data:
-            phone_digits = re.sub(r'\D', '', data['phone'])
+        if data.get('phone'):
+            phone = data['phone']
+            if phone.isascii():
+                phone_digits = phone.translate(self._NONDIGIT_DEL)
+            else:
+                phone_digits = ''.join(filter(str.isdecimal, phone))
             if phone_digits:
                 words.add(phone_digits)
                 if len(phone_digits) >= 4:
@@ -216,76 +375,158 @@ class CustomWordlistGenerator:
         if not leet_map:
             return variations
         
-        # Basic leet replacements
-        leet_word = word
+        # Basic leet replacements, lowercasing once rather than per mapping
+        word_lower = word.lower()
+        add = variations.add
         for char, replacements in leet_map.items():
-            if char in leet_word.lower():
+            if char in word_lower:
                 for replacement in replacements:
-                    variations.add(leet_word.lower().replace(char, replacement))
+                    add(word_lower.replace(char, replacement))
         
         return variations
     
-    def generate_combinations(self, base_words: Set, separators: List[str]) -> Set:
+    def apply_leet_batch(self, words: Iterable[str], leet_map: Dict) -> Set:
+        """Apply basic leet speak to a whole word set at once"""
+        words = list(words)
+        variations = set(words)
+        
+        if not leet_map or not words:
+            return variations
+        
+        # Lowercase every word in one pass over a single newline-joined buffer,
+        # then run each substitution across the whole buffer instead of per word
+        blob = '\n'.join(words).lower()
+        lowered = blob.split('\n')
+        update, replace = variations.update, blob.replace
+        for char, replacements in leet_map.items():
+            if char not in blob:
+                continue
+            has_char = [char in word for word in lowered]
+            for replacement in replacements:
+                update(itertools.compress(replace(char, replacement).split('\n'), has_char))
+        
+        return variations
+    
+    def expand_leet_speak(self, word: str, leet_map: Dict, max_variations: int = 10000) -> Iterator[str]:
+        """Yield every mix of leet substitutions for a word (exhaustive leet mode)"""
+        # One option tuple per position; product() walks all mixes in C
+        get = leet_map.get
+        options = [(char, *get(char, ())) for char in word.lower()]
+        return itertools.islice(map(''.join, itertools.product(*options)), max_variations)
+    
+    def generate_combinations(self, base_words: Set, separators: List[str],
+                              max_len: float = math.inf) -> Iterator[str]:
         """Generate combinations of base words (only if user enabled)"""
-        combinations = set()
-        
-        words_list = list(base_words)
-        
-        # Add all base words
-        combinations.update(base_words)
-        
-        # Generate 2-word combinations
-        for i in range(len(words_list)):
-            for j in range(i + 1, len(words_list)):
-                word1 = words_list[i]
-                word2 = words_list[j]
-                
-                for sep in separators:
-                    combinations.add(word1 + sep + word2)
-                    combinations.add(word2 + sep + word1)
-                
-                # Without separator
-                combinations.add(word1 + word2)
-                combinations.add(word2 + word1)
-        
-        return combinations
-    
-    def add_number_patterns(self, words: Set, number_range: List[int], custom_patterns: List[str]) -> Set:
-        """Add number patterns to words (only if user enabled)"""
-        enhanced = set()
+        # Later stages only lengthen words, so anything over max_len is dropped here
+        words_list = [word for word in base_words if len(word) <= max_len]
         
-        for word in words:
-            enhanced.add(word)  # Keep original
-            
-            # Add numbers from user-defined range
-            for num in number_range:
-                enhanced.add(word + str(num))
-                enhanced.add(str(num) + word)
-            
-            # Add custom patterns
-            for pattern in custom_patterns:
-                enhanced.add(word + pattern)
-                enhanced.add(pattern + word)
+        # Joining without a separator is just the '' separator (kept once).
+        # Shortest first, so a pair stops at the first separator that won't fit
+        separators = sorted(dict.fromkeys([*separators, '']), key=len)
+        emit = _unrolled_combinations(tuple(separators))
         
-        return enhanced
+        # All base words, then every 2-word combination
+        return itertools.chain(words_list, emit(itertools.combinations(words_list, 2), max_len))
     
-    def add_special_chars(self, words: Set, special_chars: List[str]) -> Set:
-        """Add special characters (only if user enabled)"""
-        enhanced = set()
+    def add_number_patterns(self, words: Iterable[str], number_range: List[int],
+                            custom_patterns: List[str], max_len: float = math.inf) -> Iterator[str]:
+        """Add number patterns to words (only if user enabled)"""
+        # Stringify the range once; per word the concatenations run inside map().
+        # Custom patterns that repeat a number in the range would only emit
+        # duplicate candidates, so each affix is kept once
+        affixes = sorted(dict.fromkeys(itertools.chain(map(str, number_range), custom_patterns)), key=len)
+        affix_lens = [len(affix) for affix in affixes]
         
         for word in words:
-            enhanced.add(word)  # Keep original
+            room = max_len - len(word)
+            if room < 0:
+                continue  # Too long already; affixes only make it longer
+            yield word  # Keep original
             
-            # Add special chars at beginning and end
-            for char in special_chars:
-                enhanced.add(char + word)
-                enhanced.add(word + char)
-                enhanced.add(char + word + char)
+            # Add numbers from user-defined range and custom patterns; affixes
+            # are sorted by length, so only a prefix of them fits
+            fits = affixes[:bisect.bisect_right(affix_lens, room)]
+            yield from map(word.__add__, fits)
+            yield from map(str.__add__, fits, itertools.repeat(word))
+    
+    def add_special_chars(self, words: Iterable[str], special_chars: List[str],
+                          max_len: float = math.inf) -> Iterator[str]:
+        """Add special characters (only if user enabled)"""
+        # Keeps each original, then adds chars at beginning and end, skipping
+        # any that overflow max_len
+        return _unrolled_specials(tuple(special_chars))(words, max_len)
+    
+    def expand_parallel(self, words: Iterable[str], numbers, special_chars, min_len: int,
+                        max_len: int, chunk_size: int = 64) -> Iterator[str]:
+        """Run the number and special-char stages across worker processes"""
+        words = iter(words)
+        # Words travel as newline-joined strings, which pickle far cheaper than lists
+        chunks = map('\n'.join, iter(lambda: list(itertools.islice(words, chunk_size)), []))
+        
+        with multiprocessing.Pool(initializer=_init_expand_worker,
+                                  initargs=((numbers, special_chars, min_len, max_len),)) as pool:
+            for blob in pool.imap_unordered(_expand_chunk, chunks):
+                if blob:
+                    yield from blob.split('\n')
+    
+    @staticmethod
+    def count_candidates(words: Iterable[str], separators, numbers, special_chars,
+                         min_len: int, max_len: int) -> int:
+        """Count the candidates the enabled stages will yield, before deduplication
         
-        return enhanced
+        Only word lengths matter to each stage's max_len pruning, so a length
+        histogram is pushed through the same rules instead of the words themselves.
+        """
+        lengths = Counter(map(len, words))
+        
+        # Combinations: the words that fit, then both orders of every pair for
+        # each separator that still fits
+        if separators is not None:
+            lengths = Counter({n: c for n, c in lengths.items() if n <= max_len})
+            seps = Counter(map(len, dict.fromkeys([*separators, ''])))
+            pairs = Counter()
+            for a, b in itertools.combinations_with_replacement(sorted(lengths), 2):
+                n_pairs = lengths[a] * lengths[b] if a != b else lengths[a] * (lengths[a] - 1) // 2
+                for s, c in seps.items():
+                    if a + b + s <= max_len:
+                        pairs[a + b + s] += 2 * n_pairs * c
+            lengths += pairs
+        
+        # Numbers: each word that fits, plus the word with every affix that fits
+        # appended and prepended
+        if numbers is not None:
+            number_range, custom_patterns = numbers
+            affixes = Counter(map(len, dict.fromkeys(itertools.chain(map(str, number_range), custom_patterns))))
+            grown = Counter()
+            for n, c in lengths.items():
+                if n <= max_len:
+                    grown[n] += c
+                    for a, k in affixes.items():
+                        if n + a <= max_len:
+                            grown[n + a] += 2 * c * k
+            lengths = grown
+        
+        # Specials: each word that fits, the char on either side, then on both
+        if special_chars is not None:
+            grown = Counter()
+            for n, c in lengths.items():
+                if n <= max_len:
+                    grown[n] += c
+                    for s in map(len, special_chars):
+                        if n + s <= max_len:
+                            grown[n + s] += 2 * c
+                        if n + 2 * s <= max_len:
+                            grown[n + 2 * s] += c
+            lengths = grown
+        
+        return sum(c for n, c in lengths.items() if min_len <= n <= max_len)
     
-    def generate(self, data: Dict) -> Set:
-        """Main generation function - ONLY what user defined"""
+    def generate(self, data: Dict) -> Iterator[str]:
+        """Main generation function - ONLY what user defined
+        
+        Stages after leet speak are chained generators, so candidates are
+        streamed to the caller instead of being collected in intermediate sets.
+        """
         print("\n[*] Starting generation with user-defined parameters...")
         
         # Step 1: Get base words (exactly what user provided)
@@ -293,74 +534,119 @@ class CustomWordlistGenerator:
         print(f"[+] Base words collected: {len(base_words)}")
         
         all_words = base_words.copy()
+        get = data.get
         
         # Step 2: Apply leet speak if enabled
-        if data.get('leet_enabled', False):
+        if get('leet_enabled', False):
             print("[*] Applying leet speak...")
-            leet_words = set()
-            leet_map = data.get('custom_leet', self.leet_maps)
+            leet_map = get('custom_leet', self.leet_maps)
             
-            for word in all_words:
-                leet_words.update(self.apply_leet_speak(word, leet_map))
+            # Variations go straight into all_words; no intermediate set to merge
+            if get('leet_exhaustive', False):
+                expand = self.expand_leet_speak
+                all_words.update(itertools.chain.from_iterable(
+                    [expand(word, leet_map) for word in all_words]))
+            else:
+                # The batch result already includes every original word
+                all_words = self.apply_leet_batch(all_words, leet_map)
             
-            all_words.update(leet_words)
             print(f"[+] After leet: {len(all_words)} words")
         
+        words = all_words
+        separators = None
+        min_len = get('min_length', 4)
+        max_len = get('max_length', 32)
+        
         # Step 3: Generate combinations if enabled
-        if data.get('combinations_enabled', False):
+        if get('combinations_enabled', False):
             print("[*] Generating word combinations...")
-            separators = data.get('separators', [''])
-            combos = self.generate_combinations(all_words, separators)
-            all_words.update(combos)
-            print(f"[+] After combinations: {len(all_words)} words")
+            separators = get('separators', [''])
+            words = self.generate_combinations(all_words, separators, max_len)
         
         # Step 4: Add number patterns if enabled
-        if data.get('numbers_enabled', False):
+        numbers = special_chars = None
+        if get('numbers_enabled', False):
             print("[*] Adding number patterns...")
-            number_range = data.get('number_range', range(0, 100))
-            custom_patterns = data.get('custom_patterns', [])
-            numbered = self.add_number_patterns(all_words, number_range, custom_patterns)
-            all_words.update(numbered)
-            print(f"[+] After numbers: {len(all_words)} words")
+            number_range = get('number_range', range(0, 100))
+            custom_patterns = get('custom_patterns', [])
+            numbers = (number_range, custom_patterns)
         
         # Step 5: Add special characters if enabled
-        if data.get('special_enabled', False):
+        if get('special_enabled', False):
             print("[*] Adding special characters...")
-            special_chars = data.get('special_chars', ['!', '@', '#', '$'])
-            special = self.add_special_chars(all_words, special_chars)
-            all_words.update(special)
-            print(f"[+] After special chars: {len(all_words)} words")
-        
-        # Step 6: Filter by length
-        min_len = data.get('min_length', 4)
-        max_len = data.get('max_length', 32)
+            special_chars = get('special_chars', ['!', '@', '#', '$'])
         
-        filtered = {w for w in all_words if min_len <= len(w) <= max_len}
+        # Exact candidate count (duplicates included), used to pick and size dedup
+        expected = self.count_candidates(all_words, separators, numbers, special_chars,
+                                         min_len, max_len)
         
-        print(f"[*] Filtering by length ({min_len}-{max_len}): {len(all_words)} -> {len(filtered)}")
-        
-        return filtered
+        # Each word expands independently, so big runs fan out to all cores
+        if ((numbers is not None or special_chars is not None)
+                and expected > PARALLEL_THRESHOLD and (os.cpu_count() or 1) > 1):
+            words = self.expand_parallel(words, numbers, special_chars, min_len, max_len)
+        else:
+            if numbers is not None:
+                words = self.add_number_patterns(words, *numbers, max_len)
+            if special_chars is not None:
+                words = self.add_special_chars(words, special_chars, max_len)
+        
+        # Step 6: Filter by length and drop duplicates as words stream out
+        print(f"[*] Streaming words of length {min_len}-{max_len}...")
+        
+        if expected > BLOOM_THRESHOLD:
+            # A false positive only drops a candidate, which is acceptable here
+            print(f"[*] Up to {expected:,} candidates: deduplicating with a Bloom filter")
+            seen_add = BloomFilter(expected).add
+            for word in words:
+                if min_len <= len(word) <= max_len and not seen_add(word):
+                    yield word
+        else:
+            seen = set()
+            seen_add = seen.add
+            for word in words:
+                if min_len <= len(word) <= max_len and word not in seen:
+                    seen_add(word)
+                    yield word
     
-    def save_wordlist(self, wordlist: Set, filename: str):
-        """Save wordlist to file"""
-        wordlist_list = sorted(list(wordlist))
+    def save_wordlist(self, wordlist: Iterable[str], filename: str, batch_size: int = 100000):
+        """Stream wordlist to file in generation order, returning the word count (None on error)
         
-        print(f"\n[*] Saving {len(wordlist_list):,} words to {filename}...")
+        A .gz, .bz2, .xz or .zst (needs zstandard) filename writes compressed output.
+        """
+        print(f"\n[*] Saving words to {filename}...")
         
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                for word in wordlist_list:
-                    f.write(word + '\n')
+            count = 0
+            words = iter(wordlist)
+            compressed = _open_compressed(filename)
+            if compressed is None:
+                fd = os.open(filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+            try:
+                # Encode and write batches as single blobs instead of one write per word
+                while batch := list(itertools.islice(words, batch_size)):
+                    count += len(batch)
+                    batch.append('')
+                    view = memoryview('\n'.join(batch).encode('utf-8'))
+                    if compressed is not None:
+                        compressed.write(view)
+                        continue
+                    while view:
+                        view = view[os.write(fd, view[:1 << 22]):]
+            finally:
+                if compressed is not None:
+                    compressed.close()
+                else:
+                    os.close(fd)
             
             file_size = os.path.getsize(filename)
-            print(f"[+] Successfully saved {len(wordlist_list):,} words")
+            print(f"[+] Successfully saved {count:,} words")
             print(f"[+] File size: {file_size:,} bytes ({file_size/1024/1024:.2f} MB)")
             
-            return True
+            return count
             
         except Exception as e:
             print(f"[-] Error saving file: {e}")
-            return False
+            return None
 
 def main():
     parser = argparse.ArgumentParser(
@@ -376,6 +662,9 @@ Examples:
   
   # With specific options
   python custom_generator.py --first john --leet --numbers 0-999 --special "!@#"
+  
+  # Non-interactive, all parameters from a JSON config
+  python custom_generator.py --config data.json
         """
     )
     
@@ -387,12 +676,17 @@ Examples:
     
     # Options
     parser.add_argument('--leet', action='store_true', help='Enable leet speak')
+    parser.add_argument('--leet-exhaustive', action='store_true',
+                       help='Generate every mix of leet substitutions (implies --leet)')
     parser.add_argument('--numbers', help='Number range (e.g., 0-99)')
     parser.add_argument('--special', help='Special characters to use (e.g., "!@#$")')
     
+    parser.add_argument('--config', type=argparse.FileType('r'),
+                       help='JSON file with all parameters (skips every prompt)')
+    
     # Output
     parser.add_argument('-o', '--output', default='custom_wordlist.txt',
-                       help='Output filename')
+                       help='Output filename (.gz, .bz2, .xz or .zst writes compressed)')
     
     args = parser.parse_args()
     
@@ -401,7 +695,10 @@ Examples:
     # If command line has minimal args, use interactive mode for rest
     use_interactive = not (args.first and args.last and args.birthdate)
     
-    if use_interactive:
+    if args.config:
+        with args.config:
+            data = generator.load_config(args.config)
+    elif use_interactive:
         data = generator.get_user_input()
     else:
         # Build data from command line args
@@ -420,8 +717,9 @@ Examples:
         print("\n[!] Using command line input. Configure additional options:")
         print("-" * 50)
         
-        if args.leet:
+        if args.leet or args.leet_exhaustive:
             data['leet_enabled'] = True
+            data['leet_exhaustive'] = args.leet_exhaustive
         else:
             leet_choice = input("Enable leet speak? (y/n): ").strip().lower()
             data['leet_enabled'] = leet_choice == 'y'
@@ -472,23 +770,25 @@ Examples:
     
     print(f"{'='*60}\n")
     
-    # Generate wordlist
+    # Generate wordlist (a stream of unique words)
     wordlist = generator.generate(data)
     
-    print(f"\n{'='*60}")
-    print(" GENERATION COMPLETE")
-    print(f"{'='*60}")
-    print(f" Total words generated: {len(wordlist):,}")
-    
-    if wordlist:
+    # Peek at the first words for the sample, then hand the whole stream to the writer
+    sample = list(itertools.islice(wordlist, 20))
+    if sample:
         print("\n[*] Sample of generated words:")
-        sample = list(wordlist)[:20]
         for i, word in enumerate(sample):
             print(f"  {i+1:2}. {word}")
     
     # Save
     output_file = args.output
-    generator.save_wordlist(wordlist, output_file)
+    total = generator.save_wordlist(itertools.chain(sample, wordlist), output_file)
+    
+    if total is not None:
+        print(f"\n{'='*60}")
+        print(" GENERATION COMPLETE")
+        print(f"{'='*60}")
+        print(f" Total words generated: {total:,}")
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -5,17 +5,192 @@ User-Defined with Intelligent Pattern Generation
 """
 
 import argparse
+import gzip
+import logging
 import sys
 from datetime import datetime, timedelta
 import os
 import re
+import shutil
+import subprocess
+import tempfile
 import itertools
 import math
-from typing import Set, Dict, List, Tuple, Optional
-from collections import defaultdict, deque
+from typing import Set, Dict, List, Tuple, Optional, Iterable, Iterator
+from collections import Counter, defaultdict, deque
+from dataclasses import dataclass
 import random
+import multiprocessing
+
+# Output caps above this deduplicate with a Bloom filter (~1.8 bytes/entry at
+# its 0.1% error rate) instead of the exact set of UTF-8 keys (~80 bytes/entry),
+# which at this cap would already need ~1.6 GB
+BLOOM_THRESHOLD = 20_000_000
+
+# Progress and results go through logging so --quiet can silence them
+logger = logging.getLogger(__name__)
+
+
+class BloomFilter:
+    """Approximate seen-set for max_size caps too large to remember every password
+    
+    A false positive makes generate() skip a password it never yielded, so the
+    error rate is the share of unique passwords that may go missing.
+    """
+    
+    def __init__(self, capacity: int, error_rate: float = 1e-3):
+        self.size = max(64, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+    
+    def add(self, item: str) -> bool:
+        """Mark a password as seen; True means it (probably) had been already"""
+        h = hash(item) & 0xFFFFFFFFFFFFFFFF
+        h1, h2 = h & 0xFFFFFFFF, (h >> 32) | 1
+        bits, size = self.bits, self.size
+        present = True
+        for i in range(self.hashes):
+            pos = (h1 + i * h2) % size
+            mask = 1 << (pos & 7)
+            if not bits[pos >> 3] & mask:
+                bits[pos >> 3] |= mask
+                present = False
+        return present
+
+
+class _OptionTable(dict):
+    """char -> tuple of leet options; unmapped chars resolve to (char,) and are memoised"""
+    
+    def __missing__(self, char: str) -> tuple:
+        options = self[char] = (char,)
+        return options
+
+
+_SHARD_ARGS = None  # (numbers, special_chars, min_len, max_len, share), set by _init_shard_worker
+
+
+def _init_shard_worker(numbers: List[str], special_chars: List[str],
+                       min_len: int = 0, max_len: float = math.inf, share: int = 0):
+    """Pool initializer: receive the number and special-char lists once"""
+    global _SHARD_ARGS
+    _SHARD_ARGS = (numbers, special_chars, min_len, max_len, share)
+
+
+def _combine_shard(blob: str) -> str:
+    """Pool worker: depth-2 combinations for a newline-joined shard of base words"""
+    numbers, special_chars, min_len, max_len, share = _SHARD_ARGS
+    words = blob.split('\n')
+    combos = EnhancedWordlistGenerator.affix_combinations(words, numbers, special_chars,
+                                                          min_len, max_len, share * len(words))
+    # A local set drops repeats before the shard is pickled back
+    return '\n'.join(set(combos))
+
+
+_TRANSFORM_ARGS = None  # (generator, transform options), set in each worker by _init_transform_worker
+
+
+def _init_transform_worker(options: Tuple):
+    """Pool initializer: build one generator per worker instead of pickling self per task"""
+    global _TRANSFORM_ARGS
+    _TRANSFORM_ARGS = (EnhancedWordlistGenerator(), options)
+
+
+def _transform_shard(blob: str) -> str:
+    """Pool worker: transformation variants for a newline-joined shard of base words"""
+    generator, options = _TRANSFORM_ARGS
+    variants = set(itertools.chain.from_iterable(
+        generator.transform_word(word, *options) for word in blob.split('\n')))
+    return '\n'.join(variants)
+
+
+def _reservoir_tap(stream: Iterable[str], k: int, reservoir: List[str]) -> Iterator[str]:
+    """Pass stream through unchanged while keeping a uniform sample of k items
+    
+    Algorithm L: random draws are only made at the (geometrically spaced)
+    replacements, and the skipped runs are forwarded by islice.
+    """
+    it = iter(stream)
+    for item in itertools.islice(it, k):
+        reservoir.append(item)
+        yield item
+    if len(reservoir) < k:
+        return
+    
+    def unit() -> float:
+        # Uniform draw from the open interval (0, 1), safe for log()
+        u = random.random()
+        while not u:
+            u = random.random()
+        return u
+    
+    w = math.exp(math.log(unit()) / k)
+    while w < 1:
+        yield from itertools.islice(it, math.floor(math.log(unit()) / math.log1p(-w)))
+        for item in itertools.islice(it, 1):
+            reservoir[random.randrange(k)] = item
+            yield item
+            break
+        else:
+            return
+        w *= math.exp(math.log(unit()) / k)
+    yield from it
+
+
+@dataclass(frozen=True, slots=True)
+class GenerationConfig:
+    """Generation options, read once from the collected data dict"""
+    depth: int = 3
+    leet_enabled: bool = False
+    leet_level: int = 2
+    custom_leet: Optional[Dict] = None
+    space_rule_enabled: bool = False
+    numbers_enabled: bool = False
+    number_types: Iterable[str] = ('1', '2')
+    number_ranges: Iterable[Tuple[int, int]] = ((0, 99),)
+    special_enabled: bool = False
+    special_chars: Optional[List[str]] = None  # None: the basic set
+    min_length: int = 6
+    max_length: int = 64
+    max_size: int = 1000000
+    workers: int = 1
+    
+    @classmethod
+    def from_data(cls, data: Dict) -> 'GenerationConfig':
+        """Pick the known options out of data; other keys (inputs) are ignored"""
+        return cls(**{key: data[key] for key in cls.__dataclass_fields__ if key in data})
+
 
 class EnhancedWordlistGenerator:
+    # Most number patterns smart_combine ever combines with words
+    MAX_COMBINED_NUMBERS = 100
+    
+    # Date formats tried in order by extract_date_components
+    DATE_FORMATS = (
+        '%d/%m/%Y', '%m/%d/%Y', '%Y/%m/%d',
+        '%d-%m-%Y', '%m-%d-%Y', '%Y-%m-%d',
+        '%d.%m.%Y', '%m.%d.%Y', '%Y.%m.%d',
+        '%d%m%Y', '%m%d%Y', '%Y%m%d',
+        '%d/%m/%y', '%m/%d/%y', '%y/%m/%d',
+        '%d%m%y', '%m%d%y', '%y%m%d'
+    )
+    
+    # The same formats keyed by their separators ('//', '..', '' ...). Digits are
+    # all the directives match, so a date can only parse with a format whose
+    # separators are exactly its own
+    _DATE_FORMATS_BY_SHAPE = {}
+    for _fmt in DATE_FORMATS:
+        _DATE_FORMATS_BY_SHAPE.setdefault(''.join(c for c in _fmt if c in '/-.'), []).append(_fmt)
+    del _fmt
+    
+    # Fallback patterns for dates no format matches, and vowel stripping
+    _RE_DAY = re.compile(r'\b(0[1-9]|[12][0-9]|3[01])\b')
+    _RE_MONTH = re.compile(r'\b(0[1-9]|1[0-2])\b')
+    _RE_YEAR = re.compile(r'\b(19\d{2}|20\d{2})\b')
+    _RE_VOWELS = re.compile(r'[aeiou]', re.IGNORECASE)
+    
+    # Reduces ASCII phone, zip, plate and ID entries (data['numbers']) to their digits
+    _NONDIGIT_DEL = str.maketrans('', '', ''.join(chr(c) for c in range(128) if not chr(c).isdigit()))
+    
     def __init__(self):
         # Extended leet mappings
         self.leet_maps = {
@@ -47,6 +222,12 @@ class EnhancedWordlistGenerator:
             'z': ['2', '~/_', '%']
         }
         
+        # Level-1 leet: one common substitution per variation
+        self.basic_leet = {'a': '4', 'e': '3', 'i': '1', 'o': '0', 's': '5'}
+        
+        # Per leet map: (map, level-3 options, level-4 options incl. the original char)
+        self._leet_tables = {}
+        
         # Common keyboard patterns
         self.keyboard_patterns = {
             'qwerty': ['qwerty', 'asdfgh', 'zxcvbn', 'qazwsx', '123456'],
@@ -184,12 +365,16 @@ class EnhancedWordlistGenerator:
         if data['leet_enabled']:
             print("  Levels: 1=Basic, 2=Moderate, 3=Advanced, 4=Extreme")
             leet_level = input("  Leet level (1-4): ").strip()
-            data['leet_level'] = min(max(int(leet_level) if leet_level.isdigit() else 2, 1), 4)
+            data['leet_level'] = self._clamp_int(leet_level, 1, 4, 2)
             
             leet_custom = input("  Custom leet mappings (format a=4,@ b=8, leave blank for default): ").strip()
             if leet_custom:
                 data['custom_leet'] = self.parse_custom_leet(leet_custom)
         
+        # Space rule
+        space_choice = input("\nInsert a space at every position of each word? (y/n): ").strip().lower()
+        data['space_rule_enabled'] = space_choice == 'y'
+        
         # Number generation options
         print("\n[Number Pattern Options]")
         num_choice = input("Add number patterns? (y/n): ").strip().lower()
@@ -252,22 +437,32 @@ class EnhancedWordlistGenerator:
         
         # Pattern depth
         depth = input("\nPattern generation depth (1-5, higher=more combinations): ").strip()
-        data['depth'] = min(max(int(depth) if depth.isdigit() else 3, 1), 5)
+        data['depth'] = self._clamp_int(depth, 1, 5, 3)
         
         # Length constraints
         print("\n--- LENGTH AND SIZE CONSTRAINTS ---")
         min_len = input("Minimum password length (default: 6): ").strip()
-        data['min_length'] = int(min_len) if min_len.isdigit() else 6
+        data['min_length'] = self._clamp_int(min_len, 0, math.inf, 6)
         
         max_len = input("Maximum password length (default: 64): ").strip()
-        data['max_length'] = int(max_len) if max_len.isdigit() else 64
+        data['max_length'] = self._clamp_int(max_len, 0, math.inf, 64)
         
         # Output size limit
         limit = input("Maximum wordlist size (0 for unlimited, default: 1000000): ").strip()
-        data['max_size'] = int(limit) if limit.isdigit() else 1000000
+        data['max_size'] = self._clamp_int(limit, 0, math.inf, 1000000)
+        
+        # Sorting is optional: cracking tools don't need it and it costs a full extra pass
+        sort_choice = input("Sort the saved wordlist? (y/N): ").strip().lower()
+        data['sort_output'] = sort_choice == 'y'
         
         return data
     
+    @staticmethod
+    def _clamp_int(raw: str, lo, hi, default: int) -> int:
+        """Parse a prompted integer, falling back to default and clamping to [lo, hi]"""
+        value = int(raw) if raw.isdecimal() else default
+        return lo if value < lo else hi if value > hi else value
+    
     def parse_custom_leet(self, leet_str: str) -> Dict:
         """Parse custom leet mappings from user input"""
         custom_leet = {}
@@ -300,18 +495,10 @@ class EnhancedWordlistGenerator:
         # Clean the date string
         date_str = date_str.strip()
         
-        # Try multiple date formats
-        date_formats = [
-            '%d/%m/%Y', '%m/%d/%Y', '%Y/%m/%d',
-            '%d-%m-%Y', '%m-%d-%Y', '%Y-%m-%d',
-            '%d.%m.%Y', '%m.%d.%Y', '%Y.%m.%d',
-            '%d%m%Y', '%m%d%Y', '%Y%m%d',
-            '%d/%m/%y', '%m/%d/%y', '%y/%m/%d',
-            '%d%m%y', '%m%d%y', '%y%m%d'
-        ]
-        
+        # Try the date formats with this string's separator shape, in order
         parsed_date = None
-        for fmt in date_formats:
+        shape = ''.join(c for c in date_str if c in '/-.')
+        for fmt in self._DATE_FORMATS_BY_SHAPE.get(shape, ()):
             try:
                 parsed_date = datetime.strptime(date_str, fmt)
                 break
@@ -320,9 +507,9 @@ class EnhancedWordlistGenerator:
         
         if not parsed_date:
             # Try to extract components with regex
-            day_match = re.search(r'\b(0[1-9]|[12][0-9]|3[01])\b', date_str)
-            month_match = re.search(r'\b(0[1-9]|1[0-2])\b', date_str)
-            year_match = re.search(r'\b(19\d{2}|20\d{2})\b', date_str)
+            day_match = self._RE_DAY.search(date_str)
+            month_match = self._RE_MONTH.search(date_str)
+            year_match = self._RE_YEAR.search(date_str)
             
             if day_match:
                 components['day'].append(day_match.group())
@@ -372,7 +559,7 @@ class EnhancedWordlistGenerator:
         
         return dict(components)
     
-    def generate_keyboard_patterns(self, length: int = 3) -> List[str]:
+    def generate_keyboard_patterns(self, length: int = 3) -> Set[str]:
         """Generate keyboard walk patterns"""
         patterns = []
         
@@ -408,7 +595,7 @@ class EnhancedWordlistGenerator:
         for i in range(10 - length + 1):
             patterns.append(''.join(str(j) for j in range(i, i+length)))
         
-        return list(set(patterns))
+        return set(patterns)
     
     def generate_common_patterns(self) -> List[str]:
         """Generate common password patterns"""
@@ -432,149 +619,186 @@ class EnhancedWordlistGenerator:
         
         return patterns
     
-    def apply_leet_level(self, word: str, level: int, custom_map: Dict = None) -> List[str]:
-        """Apply leet speak transformations based on level"""
-        variations = [word]
+    def _leet_option_tables(self, leet_map: Dict) -> Tuple[_OptionTable, _OptionTable]:
+        """Flat char -> options tables for a leet map, built once per map"""
+        cached = self._leet_tables.get(id(leet_map))
+        if cached is None or cached[0] is not leet_map:
+            cached = (leet_map,
+                      _OptionTable({char: tuple(subs) for char, subs in leet_map.items()}),
+                      _OptionTable({char: (char, *subs) for char, subs in leet_map.items()}))
+            self._leet_tables[id(leet_map)] = cached
+        return cached[1], cached[2]
+    
+    @staticmethod
+    def _leet_columns(options: Iterable[Tuple[str, ...]]) -> List[Tuple[str, ...]]:
+        """Merge runs of single-option positions into one fixed column for product()"""
+        columns = []
+        run = ''
+        for opts in options:
+            if len(opts) == 1:
+                run += opts[0]
+            else:
+                if run:
+                    columns.append((run,))
+                    run = ''
+                columns.append(opts)
+        if run:
+            columns.append((run,))
+        return columns
+    
+    def apply_leet_level(self, word: str, level: int, custom_map: Dict = None) -> Iterator[str]:
+        """Apply leet speak transformations based on level (yields variations lazily)"""
+        yield word
         
         leet_map = custom_map or self.leet_maps
         
         if level == 1:
             # Basic: only common substitutions
-            basic_leet = {'a': '4', 'e': '3', 'i': '1', 'o': '0', 's': '5'}
-            for char, sub in basic_leet.items():
+            for char, sub in self.basic_leet.items():
                 if char in word:
-                    variations.append(word.replace(char, sub))
+                    yield word.replace(char, sub)
         
         elif level == 2:
             # Moderate: more substitutions
             for char, subs in leet_map.items():
                 if char in word:
                     for sub in subs[:2]:  # First two substitutions
-                        variations.append(word.replace(char, sub))
+                        yield word.replace(char, sub)
         
         elif level == 3:
             # Advanced: multiple substitutions per word
-            chars_to_replace = [c for c in word if c in leet_map]
+            replaceable = sum(map(leet_map.__contains__, word))
             
-            if len(chars_to_replace) <= 3:
-                # Try all combinations for few replaceable chars
-                for combo in itertools.product(*[leet_map.get(c, [c]) for c in word]):
-                    variations.append(''.join(combo))
+            if replaceable <= 3:
+                # Try all combinations for few replaceable chars, one at a time
+                subs_table = self._leet_option_tables(leet_map)[0]
+                columns = self._leet_columns(map(subs_table.__getitem__, word))
+                yield from map(''.join, itertools.product(*columns))
         
         elif level == 4:
             # Extreme: all possible combinations
-            char_options = []
-            for char in word:
-                if char in leet_map:
-                    options = [char] + leet_map[char]
-                    char_options.append(options)
-                else:
-                    char_options.append([char])
+            char_options = list(map(self._leet_option_tables(leet_map)[1].__getitem__, word))
             
             # Limit to reasonable combinations (avoid explosion)
             max_combinations = 1000
-            combo_count = math.prod(len(opts) for opts in char_options)
+            combo_count = math.prod(map(len, char_options))
             
             if combo_count <= max_combinations:
-                for combo in itertools.product(*char_options):
-                    variations.append(''.join(combo))
+                yield from map(''.join, itertools.product(*self._leet_columns(char_options)))
             else:
-                # Sample random combinations
-                for _ in range(max_combinations):
-                    new_word = []
-                    for opts in char_options:
-                        new_word.append(random.choice(opts))
-                    variations.append(''.join(new_word))
-        
-        return list(set(variations))
+                # Sample random combinations: draw each position's column in one
+                # choices() call, then zip the columns back into words. Positions
+                # with a single option need no random draws at all
+                columns = [random.choices(opts, k=max_combinations) if len(opts) > 1
+                           else itertools.repeat(opts[0], max_combinations)
+                           for opts in char_options]
+                yield from map(''.join, zip(*columns))
     
-    def apply_case_variations(self, word: str) -> List[str]:
-        """Generate case variations of a word"""
-        variations = set()
-        
-        # Basic variations
-        variations.add(word.lower())
-        variations.add(word.upper())
-        variations.add(word.title())
-        variations.add(word.capitalize())
+    def apply_case_variations(self, word: str) -> Iterator[str]:
+        """Generate case variations of a word (yields lazily; the caller deduplicates)"""
+        # Basic variations (each case transform computed once)
+        yield word.lower()
+        yield word.upper()
+        yield word.title()
+        yield word.capitalize()
         
         # Random case (toggle style)
         if len(word) <= 8:
-            # Generate all binary case variations for short words
-            for mask in range(2 ** len(word)):
-                chars = []
-                for i, char in enumerate(word):
-                    if (mask >> i) & 1:
-                        chars.append(char.upper())
-                    else:
-                        chars.append(char.lower())
-                variations.add(''.join(chars))
+            # Generate all binary case variations for short words; product() over
+            # (lower, upper) pairs walks every mask in C. Caseless characters
+            # (digits, symbols) get a single option, so their would-be duplicate
+            # masks are never enumerated
+            case_options = []
+            for char in word:
+                lower, upper = char.lower(), char.upper()
+                case_options.append((lower, upper) if lower != upper else (lower,))
+            yield from map(''.join, itertools.product(*self._leet_columns(case_options)))
         else:
-            # For longer words, use common patterns
-            patterns = [
-                word[0].upper() + word[1:].lower(),  # First letter capital
-                word.lower(),
-                word.upper(),
-                word.title(),
-                word[0].lower() + word[1:].upper(),  # camelCase style
-            ]
-            variations.update(patterns)
-        
-        return list(variations)
+            # For longer words, use common patterns (lower/upper/title are
+            # already yielded above)
+            yield word[0].upper() + word[1:].lower()  # First letter capital
+            yield word[0].lower() + word[1:].upper()  # camelCase style
     
-    def apply_phonetic_substitutions(self, word: str) -> List[str]:
+    def apply_phonetic_substitutions(self, word: str) -> Set[str]:
         """Apply phonetic substitutions"""
-        variations = [word]
+        variations = {word}
         
         for phonetic, sub in self.phonetic_subs.items():
             if phonetic in word:
-                variations.append(word.replace(phonetic, sub))
+                variations.add(word.replace(phonetic, sub))
         
         # Reverse substitutions
         for sub, phonetic in self.phonetic_subs.items():
             if sub in word:
-                variations.append(word.replace(sub, phonetic))
+                variations.add(word.replace(sub, phonetic))
         
-        return list(set(variations))
+        return variations
     
-    def apply_word_mangling(self, word: str) -> List[str]:
-        """Mangle words by adding/removing characters"""
-        variations = set()
-        
-        variations.add(word)
+    def apply_word_mangling(self, word: str) -> Iterator[str]:
+        """Mangle words by adding/removing characters (yields lazily; the caller deduplicates)"""
+        yield word
         
         # Double letters
         for i in range(len(word)):
-            mangled = word[:i] + word[i] + word[i:]
-            variations.add(mangled)
+            yield word[:i] + word[i] + word[i:]
         
         # Remove vowels
-        no_vowels = re.sub(r'[aeiou]', '', word, flags=re.IGNORECASE)
+        no_vowels = self._RE_VOWELS.sub('', word)
         if no_vowels:
-            variations.add(no_vowels)
+            yield no_vowels
         
-        # Remove duplicates
-        deduped = ''
-        for char in word:
-            if not deduped or char != deduped[-1]:
-                deduped += char
+        # Remove duplicates (collapse runs of the same letter)
+        deduped = ''.join(char for char, _ in itertools.groupby(word))
         if deduped != word:
-            variations.add(deduped)
+            yield deduped
         
         # Reverse word
-        variations.add(word[::-1])
+        yield word[::-1]
         
         # Add common prefixes/suffixes
         prefixes = ['super', 'mega', 'ultra', 'hyper', 'neo']
         suffixes = ['123', '!', '2024', 'admin', 'user']
         
         for prefix in prefixes:
-            variations.add(prefix + word)
+            yield prefix + word
         
         for suffix in suffixes:
-            variations.add(word + suffix)
+            yield word + suffix
+    
+    def transform_word(self, word: str, leet_level: int = 0, custom_map: Dict = None,
+                       mangle: bool = True, space_rule: bool = False) -> Iterator[str]:
+        """All transformation variants of one base word (leet_level 0 disables leet)
+        
+        The enabled stages are picked once per word and chained, so variants
+        flow straight from each helper without passing through another generator.
+        """
+        stages = [(word,)]
+        
+        # Case variations
+        if len(word) <= 10:  # Limit for performance
+            stages.append(self.apply_case_variations(word))
         
-        return list(variations)
+        # Leet speak
+        if leet_level:
+            stages.append(self.apply_leet_level(word, leet_level, custom_map))
+        
+        # Phonetic substitutions
+        stages.append(self.apply_phonetic_substitutions(word))
+        
+        # Word mangling (for depth >= 3)
+        if mangle:
+            stages.append(self.apply_word_mangling(word))
+        
+        # Space rule
+        if space_rule:
+            stages.append(self.apply_space_rule(word))
+        
+        return itertools.chain.from_iterable(stages)
+    
+    def apply_space_rule(self, word: str) -> Iterator[str]:
+        """Walk a single space through every position of the word, ends included"""
+        return map(str.__add__, [word[:i] + ' ' for i in range(len(word) + 1)],
+                   [word[i:] for i in range(len(word) + 1)])
     
     def generate_combinations(self, words: List[str], strategy: str, 
                             separators: List[str] = None) -> List[str]:
@@ -585,26 +809,22 @@ class EnhancedWordlistGenerator:
             return []
         
         if strategy == 'simple':
-            # All pairwise combinations
-            for i in range(len(words)):
-                for j in range(len(words)):
-                    if i != j:
-                        combinations.add(words[i] + words[j])
+            # All pairwise combinations (permutations() skips self-pairs in C)
+            combinations.update(map(''.join, itertools.permutations(words, 2)))
         
         elif strategy == 'separators':
             # Combinations with separators
-            separators = separators or ['']
-            for word1 in words:
-                for word2 in words:
-                    for sep in separators:
-                        combinations.add(word1 + sep + word2)
+            pairs = list(itertools.product(words, words))
+            for sep in separators or ['']:
+                combinations.update(map(sep.join, pairs))
         
         elif strategy == 'camelcase':
-            # CamelCase and PascalCase combinations
-            for word1 in words:
-                for word2 in words:
-                    combinations.add(word1.title() + word2.title())
-                    combinations.add(word1.lower() + word2.title())
+            # CamelCase and PascalCase combinations; each word is cased once
+            titles = [word.title() for word in words]
+            lowers = [word.lower() for word in words]
+            for title1, lower1 in zip(titles, lowers):
+                combinations.update(map(title1.__add__, titles))
+                combinations.update(map(lower1.__add__, titles))
         
         elif strategy == 'three_word':
             # Three word combinations
@@ -616,17 +836,16 @@ class EnhancedWordlistGenerator:
         
         return list(combinations)
     
-    def generate_number_patterns(self, types: List[str], ranges: List[Tuple[int, int]] = None) -> List[str]:
+    def generate_number_patterns(self, types: List[str], ranges: List[Tuple[int, int]] = None) -> Set[str]:
         """Generate number patterns based on types"""
         patterns = set()
         
         if '1' in types and ranges:
             # Simple ranges
             for start, end in ranges:
-                for num in range(start, end + 1):
-                    patterns.add(str(num))
-                    if len(str(num)) == 1:
-                        patterns.add(f"0{num}")  # Zero-padded
+                patterns.update(map(str, range(start, end + 1)))
+                # Zero-padded single digits (only 0-9 stringify to one char)
+                patterns.update(f"0{num}" for num in range(max(start, 0), min(end, 9) + 1))
         
         if '2' in types:
             # Common patterns
@@ -638,9 +857,9 @@ class EnhancedWordlistGenerator:
         
         if '3' in types:
             # Year patterns
-            for year in self.year_ranges['recent_years']:
-                patterns.add(str(year))
-                patterns.add(str(year)[2:])  # Short year
+            years = list(map(str, self.year_ranges['recent_years']))
+            patterns.update(years)
+            patterns.update(year[2:] for year in years)  # Short year
         
         if '4' in types:
             # Keyboard patterns
@@ -650,93 +869,220 @@ class EnhancedWordlistGenerator:
         if '5' in types:
             # Sequential and repeating
             for length in [2, 3, 4]:
-                for start in range(10 - length):
-                    seq = ''.join(str(i) for i in range(start, start + length))
-                    patterns.add(seq)
-                
-                for digit in range(10):
-                    patterns.add(str(digit) * length)
+                patterns.update('0123456789'[start:start + length] for start in range(10 - length))
+                patterns.update(digit * length for digit in '0123456789')
         
-        return list(patterns)
+        return patterns
+    
+    @staticmethod
+    def _shard_blobs(words: List[str], workers: int) -> List[str]:
+        """Split words into newline-joined shards, about four per worker"""
+        shard_size = max(1, min(256, len(words) // (workers * 4)))
+        return ['\n'.join(words[i:i + shard_size])
+                for i in range(0, len(words), shard_size)]
+    
+    @staticmethod
+    def affix_count(words: Iterable[str], numbers: List[str], special_chars: List[str],
+                    min_len: int = 0, max_len: float = math.inf) -> int:
+        """How many combinations affix_combinations yields for these words (repeats included)
+        
+        Counted from the length histograms of the parts; no string is built.
+        """
+        number_lens = Counter(map(len, numbers[:EnhancedWordlistGenerator.MAX_COMBINED_NUMBERS])).items()
+        special_lens = Counter(map(len, special_chars[:10])).items()
+        total = 0
+        for word_len, word_count in Counter(map(len, words)).items():
+            for num_len, num_count in number_lens:
+                length = word_len + num_len
+                if length > max_len:
+                    continue
+                if length >= min_len:
+                    total += 2 * word_count * num_count
+                
+                for special_len, special_count in special_lens:
+                    length = word_len + num_len + special_len
+                    if length > max_len:
+                        continue
+                    per_special = 2 if length >= min_len else 0
+                    if min_len <= length + special_len <= max_len:
+                        per_special += 1
+                    total += per_special * word_count * num_count * special_count
+        return total
+    
+    @staticmethod
+    def affix_combinations(words: Iterable[str], numbers: List[str],
+                           special_chars: List[str], min_len: int = 0,
+                           max_len: float = math.inf, budget: int = 0,
+                           leftovers: Optional[List[Iterator[str]]] = None) -> Iterator[str]:
+        """Depth-2 number prefixes/suffixes with special characters, per word
+        
+        Only combinations of min_len..max_len characters are built; their
+        lengths are summed from the parts, never measured with len(). A budget
+        splits that many combinations evenly across the words, and whatever a
+        word leaves unused is passed on to the next one. The streams of words
+        cut short are appended to leftovers, so they can resume later.
+        """
+        if budget:
+            words = list(words)
+            share = budget // len(words) if words else 0
+            allowance = 0
+            for word in words:
+                allowance += share
+                stream = EnhancedWordlistGenerator.affix_combinations(
+                    (word,), numbers, special_chars, min_len, max_len)
+                combos = list(itertools.islice(stream, allowance))
+                allowance -= len(combos)
+                yield from combos
+                if not allowance and leftovers is not None:
+                    leftovers.append(stream)
+            return
+        
+        numbers = numbers[:EnhancedWordlistGenerator.MAX_COMBINED_NUMBERS]
+        special_chars = special_chars[:10]
+        # Lengths are measured once, next to the strings they belong to
+        sized_numbers = list(zip(numbers, map(len, numbers)))
+        sized_specials = list(zip(special_chars, map(len, special_chars)))
+        for word in words:
+            word_len = len(word)
+            if word_len > max_len:
+                continue
+            for num, num_len in sized_numbers:
+                length = word_len + num_len
+                if length > max_len:
+                    continue
+                if length >= min_len:
+                    yield word + num
+                    yield num + word
+                
+                # Add special characters
+                for special, special_len in sized_specials:
+                    length = word_len + num_len + special_len
+                    if length > max_len:
+                        continue
+                    if length >= min_len:
+                        yield special + word + num
+                        yield word + num + special
+                    if min_len <= length + special_len <= max_len:
+                        yield special + word + special + num
     
     def smart_combine(self, base_words: List[str], numbers: List[str], 
-                     special_chars: List[str], depth: int) -> Set[str]:
-        """Intelligently combine elements based on depth"""
-        all_passwords = set()
+                     special_chars: List[str], depth: int, workers: int = 1,
+                     min_len: int = 0, max_len: float = math.inf,
+                     budget: int = 0,
+                     leftovers: Optional[List[Iterator[str]]] = None) -> Iterator[str]:
+        """Intelligently combine elements based on depth
+        
+        Yields only candidates of min_len..max_len characters (they may repeat).
+        With a budget, the base words and the bounded depth-3+ combinations are
+        kept whole and the depth-2 affixes share the rest evenly per base word,
+        rather than the first few words using up the whole output cap. The
+        affixes a word's share cut off are left in leftovers for a top-up.
+        If every candidate fits in the budget, nothing is split.
+        """
+        def in_range(word: str) -> bool:
+            return min_len <= len(word) <= max_len
         
         # Base words
-        all_passwords.update(base_words)
+        words_in_range = list(filter(in_range, base_words))
+        yield from words_in_range
+        
+        # Depth 3+ output is small and bounded; it is built first so its size is
+        # known when the depth-2 budget is split
+        deep = []
+        if depth >= 3:
+            deep = list(filter(in_range, self.deep_combinations(base_words, numbers,
+                                                               special_chars, depth)))
+        
+        affix_budget = 0
+        if budget and base_words:
+            # Counted from the part lengths, so the common under-the-cap run
+            # skips the split (and the top-up) entirely
+            affix_total = (self.affix_count(base_words, numbers, special_chars, min_len, max_len)
+                           if depth >= 2 else 0)
+            if len(words_in_range) + len(deep) + affix_total > budget:
+                affix_budget = max(len(base_words), budget - len(words_in_range) - len(deep))
         
         if depth >= 2:
-            # Add number suffixes/prefixes
-            for word in base_words:
-                for num in numbers[:min(100, len(numbers))]:  # Limit to 100 numbers
-                    all_passwords.add(word + num)
-                    all_passwords.add(num + word)
-                    
-                    # Add special characters
-                    for special in special_chars[:min(10, len(special_chars))]:
-                        all_passwords.add(special + word + num)
-                        all_passwords.add(word + num + special)
-                        all_passwords.add(special + word + special + num)
+            # Add number suffixes/prefixes; every base word is independent, so
+            # with several workers the words are sharded across processes
+            if workers > 1 and len(base_words) > 1:
+                with multiprocessing.Pool(workers, initializer=_init_shard_worker,
+                                          initargs=(numbers[:self.MAX_COMBINED_NUMBERS],
+                                                    special_chars[:10], min_len,
+                                                    max_len, affix_budget // len(base_words))) as pool:
+                    for blob in pool.imap_unordered(_combine_shard,
+                                                    self._shard_blobs(base_words, workers)):
+                        if blob:
+                            yield from blob.split('\n')
+                # Shards can't hand their cut-short streams back; the top-up
+                # walks the affixes again in this process (no second pool)
+                if affix_budget and leftovers is not None:
+                    leftovers.append(self.affix_combinations(base_words, numbers, special_chars,
+                                                             min_len, max_len))
+            else:
+                yield from self.affix_combinations(base_words, numbers, special_chars,
+                                                   min_len, max_len, affix_budget, leftovers)
         
+        yield from deep
+    
+    def deep_combinations(self, base_words: List[str], numbers: List[str],
+                          special_chars: List[str], depth: int) -> Iterator[str]:
+        """Depth 3+ word pairs, separator and template combinations (unfiltered)"""
         if depth >= 3:
             # Word combinations
             word_combinations = self.generate_combinations(base_words[:10], 'simple')
-            all_passwords.update(word_combinations)
+            yield from word_combinations
             
             # Add numbers to combinations
-            for combo in word_combinations[:min(100, len(word_combinations))]:
-                for num in numbers[:min(20, len(numbers))]:
-                    all_passwords.add(combo + num)
+            yield from map(''.join, itertools.product(word_combinations[:100], numbers[:20]))
         
         if depth >= 4:
             # Advanced patterns with separators
             separators = self.common_separators
-            for word1 in base_words[:5]:
-                for word2 in base_words[:5]:
+            pair_words = base_words[:5]
+            pair_numbers = numbers[:10]
+            pair_specials = special_chars[:3]
+            for word1 in pair_words:
+                for word2 in pair_words:
                     for sep in separators:
                         combo = word1 + sep + word2
-                        all_passwords.add(combo)
+                        yield combo
                         
-                        # Add numbers and specials
-                        for num in numbers[:min(10, len(numbers))]:
-                            all_passwords.add(combo + num)
-                            for special in special_chars[:3]:
-                                all_passwords.add(special + combo + num + special)
+                        # Add numbers and specials; combo + num is shared by every special
+                        for num in pair_numbers:
+                            combo_num = combo + num
+                            yield combo_num
+                            for special in pair_specials:
+                                yield special + combo_num + special
         
         if depth >= 5:
             # Extreme combinations (limited to avoid explosion)
-            extreme_combos = set()
             sample_words = base_words[:3]
             sample_nums = numbers[:5]
             sample_specials = special_chars[:3]
             
-            # Generate template-based passwords
+            # Generate template-based passwords; fields are positional (0=word,
+            # 1=num, 2=special) so each template's bound format() can be fed
+            # straight from product() with no per-password Python frame
             templates = [
-                '{word}{num}{special}',
-                '{special}{word}{num}',
-                '{word}{special}{num}{special}',
-                '{num}{word}{num}'
+                '{0}{1}{2}',
+                '{2}{0}{1}',
+                '{0}{2}{1}{2}',
+                '{1}{0}{1}'
             ]
             
+            triples = list(itertools.product(sample_words, sample_nums, sample_specials))
             for template in templates:
-                for word in sample_words:
-                    for num in sample_nums:
-                        for special in sample_specials:
-                            extreme_combos.add(template.format(
-                                word=word, num=num, special=special
-                            ))
-            
-            all_passwords.update(extreme_combos)
-        
-        return all_passwords
+                yield from itertools.starmap(template.format, triples)
     
-    def generate(self, data: Dict) -> Set[str]:
-        """Main generation function with advanced algorithms"""
-        print("\n[*] Starting advanced generation...")
+    def generate(self, data: Dict) -> Iterator[str]:
+        """Main generation function with advanced algorithms
         
-        all_passwords = set()
+        Candidates are streamed: each one is length-filtered by its producer and
+        deduplicated as it arrives, and generation stops as soon as max_size is reached.
+        """
+        logger.info("\n[*] Starting advanced generation...")
+        cfg = GenerationConfig.from_data(data)
         
         # === EXTRACT BASE WORDS ===
         base_words = set()
@@ -767,130 +1113,217 @@ class EnhancedWordlistGenerator:
             base_words.update(data['keywords'])
         
         # Numbers
-        number_patterns = set()
+        digit_patterns = set()
         if 'numbers' in data:
             for num_str in data['numbers'].values():
                 if num_str:
                     # Extract pure digits
-                    digits = re.sub(r'\D', '', num_str)
+                    if num_str.isascii():
+                        digits = num_str.translate(self._NONDIGIT_DEL)
+                    else:
+                        digits = ''.join(filter(str.isdecimal, num_str))
                     if digits:
-                        base_words.add(digits)
+                        digit_patterns.add(digits)
                         if len(digits) >= 4:
-                            base_words.add(digits[-4:])  # Last 4 digits
+                            digit_patterns.add(digits[-4:])  # Last 4 digits
+        base_words.update(digit_patterns)
         
-        print(f"[+] Base words extracted: {len(base_words)}")
+        logger.info(f"[+] Base words extracted: {len(base_words)}")
         
         # === APPLY TRANSFORMATIONS ===
-        transformed_words = set()
-        
-        for word in base_words:
-            transformed_words.add(word)
-            
-            # Case variations
-            if len(word) <= 10:  # Limit for performance
-                transformed_words.update(self.apply_case_variations(word))
-            
-            # Leet speak
-            if data.get('leet_enabled', False):
-                leet_level = data.get('leet_level', 2)
-                custom_map = data.get('custom_leet')
-                transformed_words.update(
-                    self.apply_leet_level(word, leet_level, custom_map)
-                )
-            
-            # Phonetic substitutions
-            transformed_words.update(self.apply_phonetic_substitutions(word))
-            
-            # Word mangling (for depth >= 3)
-            if data.get('depth', 3) >= 3:
-                transformed_words.update(self.apply_word_mangling(word))
+        options = (cfg.leet_level if cfg.leet_enabled else 0,
+                   cfg.custom_leet,
+                   cfg.depth >= 3,
+                   cfg.space_rule_enabled)
+        workers = cfg.workers
+        
+        if workers > 1 and len(base_words) > 1:
+            # Every base word transforms independently, so shards of words are
+            # expanded across processes and come back as newline-joined blobs
+            with multiprocessing.Pool(workers, initializer=_init_transform_worker,
+                                      initargs=(options,)) as pool:
+                blobs = pool.imap_unordered(_transform_shard,
+                                            self._shard_blobs(list(base_words), workers))
+                transformed_words = set(itertools.chain.from_iterable(
+                    blob.split('\n') for blob in blobs))
+        else:
+            # One set built from the chained per-word streams, not an update() per word
+            transformed_words = set(itertools.chain.from_iterable(
+                self.transform_word(word, *options) for word in base_words))
         
-        print(f"[+] After transformations: {len(transformed_words)} words")
+        logger.info(f"[+] After transformations: {len(transformed_words)} words")
         
         # === GENERATE NUMBER PATTERNS ===
-        number_patterns = set()
-        if data.get('numbers_enabled', False):
-            number_types = data.get('number_types', ['1', '2'])
-            ranges = data.get('number_ranges', [(0, 99)])
-            number_patterns.update(self.generate_number_patterns(number_types, ranges))
-            print(f"[+] Number patterns generated: {len(number_patterns)}")
+        # The user's own numbers are combined alongside the generated patterns
+        number_patterns = digit_patterns
+        if cfg.numbers_enabled:
+            # The generated set is the big one (a wide range can hold millions), so
+            # the few user digits are merged into it instead of copying it
+            number_patterns = self.generate_number_patterns(cfg.number_types, cfg.number_ranges)
+            number_patterns.update(digit_patterns)
+            logger.info(f"[+] Number patterns generated: {len(number_patterns)}")
         
         # === GENERATE SPECIAL CHARACTER PATTERNS ===
         special_chars = []
-        if data.get('special_enabled', False):
-            special_chars = data.get('special_chars', self.special_char_sets['basic'])
+        if cfg.special_enabled:
+            special_chars = (self.special_char_sets['basic'] if cfg.special_chars is None
+                             else cfg.special_chars)
         
         # === INTELLIGENT COMBINATION ===
-        depth = data.get('depth', 3)
+        depth = cfg.depth
         base_word_list = list(transformed_words)
-        number_list = list(number_patterns)
-        
-        print(f"[*] Generating combinations (depth: {depth})...")
+        # Only the first MAX_COMBINED_NUMBERS are ever used, so large ranges are
+        # not copied out of the pattern set in full
+        number_list = list(itertools.islice(number_patterns, self.MAX_COMBINED_NUMBERS))
+        # This generator stays suspended for the whole stream; drop the working
+        # sets now so they aren't held alongside the dedup set until the end
+        del base_words, transformed_words, number_patterns, digit_patterns
         
-        combined = self.smart_combine(
-            base_word_list, 
-            number_list, 
-            special_chars, 
-            depth
-        )
+        min_len = cfg.min_length
+        max_len = cfg.max_length
         
-        all_passwords.update(combined)
-        print(f"[+] After combination: {len(all_passwords)} passwords")
+        logger.info(f"[*] Generating combinations (depth: {depth})...")
         
-        # === ADD COMMON PATTERNS ===
+        # Common and keyboard patterns are small; they are appended after the
+        # combinations and their share of max_size is reserved up front
+        patterns = []
         if depth >= 2:
             common_patterns = self.generate_common_patterns()
             keyboard_patterns = self.generate_keyboard_patterns()
-            
-            all_passwords.update(common_patterns)
-            all_passwords.update(keyboard_patterns)
-            
-            print(f"[+] Added {len(common_patterns)} common patterns")
-            print(f"[+] Added {len(keyboard_patterns)} keyboard patterns")
+            patterns = [p for p in itertools.chain(common_patterns, keyboard_patterns)
+                        if min_len <= len(p) <= max_len]
         
-        # === FILTER AND LIMIT ===
-        min_len = data.get('min_length', 6)
-        max_len = data.get('max_length', 64)
-        max_size = data.get('max_size', 1000000)
+        max_size = cfg.max_size
+        budget = max(1, max_size - len(patterns)) if max_size > 0 else 0
         
-        filtered = {p for p in all_passwords if min_len <= len(p) <= max_len}
+        # Candidates arrive already length-filtered, so nothing out of range is hashed
+        leftovers = []
+        candidates = self.smart_combine(base_word_list, number_list, special_chars, depth,
+                                        workers, min_len, max_len, budget, leftovers)
         
-        print(f"[*] Filtering by length ({min_len}-{max_len}): "
-              f"{len(all_passwords)} -> {len(filtered)}")
-        
-        # Limit output size if specified
-        if 0 < max_size < len(filtered):
-            filtered = set(list(filtered)[:max_size])
-            print(f"[*] Limited to {max_size} passwords")
+        # === ADD COMMON PATTERNS ===
+        if depth >= 2:
+            candidates = itertools.chain(candidates, patterns)
+            
+            logger.info(f"[+] Adding {len(common_patterns)} common patterns")
+            logger.info(f"[+] Adding {len(keyboard_patterns)} keyboard patterns")
+        
+        # Repeats can leave the budgeted pass short of max_size; the affix
+        # streams it cut short then resume where they stopped (lazily, so
+        # they only run when needed)
+        if budget:
+            candidates = itertools.chain(candidates, itertools.chain.from_iterable(leftovers))
+        
+        # === LIMIT ===
+        logger.info(f"[*] Streaming passwords of length {min_len}-{max_len}"
+              + (f", up to {max_size:,}" if max_size > 0 else ""))
+        
+        # The exact set is bounded by max_size; only huge caps need the Bloom filter
+        if max_size > BLOOM_THRESHOLD:
+            logger.info(f"[*] Cap above {BLOOM_THRESHOLD:,}: deduplicating with a Bloom filter"
+                        " (about 0.1% of unique passwords may be skipped)")
+            seen_add = BloomFilter(max_size).add
+            fresh = (word for word in candidates if not seen_add(word))
+        else:
+            # The set keeps each word's UTF-8 bytes rather than the yielded str:
+            # once written and dropped, a word costs ~16 bytes less to remember
+            seen = set()
+            seen_add = seen.add
+            encode = str.encode
+            fresh = (word for word in candidates
+                     if (key := encode(word)) not in seen and not seen_add(key))
+        
+        # islice applies the cap in C; max_size 0 means no cap
+        yield from itertools.islice(fresh, max_size or None)
+        if max_size > 0 and next(fresh, None) is not None:
+            logger.info(f"[*] Limited to {max_size} passwords")
+    
+    @staticmethod
+    def sorted_stream(wordlist: Iterable[str]) -> Iterator[str]:
+        """Sort a word stream on disk with the system sort, which spills to disk
         
-        return filtered
+        Falls back to an in-memory sorted() where no POSIX sort is available.
+        LC_ALL=C byte order matches Python's code-point order for UTF-8.
+        """
+        sort_cmd = shutil.which('sort') if os.name == 'posix' else None
+        if sort_cmd is None:
+            yield from sorted(wordlist)
+            return
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            unsorted_path = os.path.join(tmp, 'unsorted')
+            sorted_path = os.path.join(tmp, 'sorted')
+            with open(unsorted_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                words = iter(wordlist)
+                for batch in iter(lambda: list(itertools.islice(words, 8192)), []):
+                    f.write('\n'.join(batch) + '\n')
+            subprocess.run([sort_cmd, '-o', sorted_path, unsorted_path], check=True,
+                           env=dict(os.environ, LC_ALL='C'))
+            with open(sorted_path, encoding='utf-8', newline='\n') as f:
+                for line in f:
+                    yield line[:-1]
     
-    def save_wordlist(self, wordlist: Set[str], filename: str):
-        """Save wordlist to file with metadata"""
-        wordlist_list = sorted(list(wordlist))
+    def save_wordlist(self, wordlist: Iterable[str], filename: str, sort: bool = False):
+        """Stream wordlist to file with metadata, returning the count (None on error)
+        
+        A .gz filename is written gzip-compressed (level 1, faster than most disks).
+        Words are written in stream order; with sort they are sorted first
+        (see sorted_stream).
+        """
+        logger.info(f"\n[*] Saving passwords to {filename}...")
         
-        print(f"\n[*] Saving {len(wordlist_list):,} passwords to {filename}...")
+        compressed = filename.lower().endswith('.gz')
+        if sort:
+            wordlist = self.sorted_stream(wordlist)
         
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                # Add metadata header
-                f.write(f"# Wordlist generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(f"# Total passwords: {len(wordlist_list):,}\n")
-                f.write("#" * 80 + "\n\n")
-                
-                # Write passwords
-                for word in wordlist_list:
-                    f.write(word + '\n')
+            count = 0
+            stamp = f"# Wordlist generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+            words = iter(wordlist)
+            if compressed:
+                with gzip.open(filename, 'wt', encoding='utf-8', compresslevel=1) as f:
+                    # A gzip stream can't seek back, so the total goes in a trailer
+                    f.write(stamp + "#" * 80 + "\n\n")
+                    for batch in iter(lambda: list(itertools.islice(words, 8192)), []):
+                        f.write('\n'.join(batch) + '\n')
+                        count += len(batch)
+                    f.write(f"# Total passwords: {count:,}\n")
+            else:
+                # Plain files are written straight to the descriptor: each batch is
+                # encoded into one buffer and handed to os.write in 4 MiB slices
+                fd = os.open(filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+                try:
+                    if hasattr(os, 'posix_fadvise'):
+                        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                    
+                    def write_all(data: bytes):
+                        view = memoryview(data)
+                        while view:
+                            view = view[os.write(fd, view[:1 << 22]):]
+                    
+                    # The total is only known once the stream is drained, so room
+                    # is reserved for it in the header and patched in at the end
+                    total_pos = len(stamp.encode('utf-8'))
+                    write_all(f"{stamp}# Total passwords: {'':<20}\n{'#' * 80}\n\n".encode('utf-8'))
+                    while batch := list(itertools.islice(words, 8192)):
+                        count += len(batch)
+                        batch.append('')
+                        write_all('\n'.join(batch).encode('utf-8'))
+                    
+                    os.lseek(fd, total_pos, os.SEEK_SET)
+                    write_all(f"# Total passwords: {count:<20,}".encode('utf-8'))
+                finally:
+                    os.close(fd)
             
             file_size = os.path.getsize(filename)
-            print(f"[+] Successfully saved {len(wordlist_list):,} passwords")
-            print(f"[+] File size: {file_size:,} bytes ({file_size/1024/1024:.2f} MB)")
+            logger.info(f"[+] Successfully saved {count:,} passwords")
+            logger.info(f"[+] File size: {file_size:,} bytes ({file_size/1024/1024:.2f} MB)")
             
-            return True
+            return count
             
         except Exception as e:
-            print(f"[-] Error saving file: {e}")
-            return False
+            logger.error(f"[-] Error saving file: {e}")
+            return None
 
 def main():
     parser = argparse.ArgumentParser(
@@ -925,20 +1358,34 @@ Examples:
                        help='Generation depth (1-5)')
     parser.add_argument('--leet', type=int, choices=range(1, 5), default=2,
                        help='Leet speak level (1-4)')
+    parser.add_argument('--space-rule', action='store_true',
+                       help='Also insert a single space at every position of each word')
     
     # Output
     parser.add_argument('-o', '--output', default='enhanced_wordlist.txt',
-                       help='Output filename')
+                       help='Output filename (a .gz name writes gzip-compressed output)')
     parser.add_argument('--max-size', type=int, default=1000000,
                        help='Maximum number of passwords to generate')
+    parser.add_argument('--sort', action='store_true',
+                       help='Write the wordlist sorted (uses the system sort, which spills to disk)')
+    parser.add_argument('-q', '--quiet', action='store_true',
+                       help='Only report warnings and errors')
+    parser.add_argument('--workers', type=int, default=1,
+                       help='Worker processes for word transformations and number/special combinations (default: 1)')
     
     args = parser.parse_args()
     
+    logging.basicConfig(level=logging.WARNING if args.quiet else logging.INFO,
+                        format='%(message)s', stream=sys.stdout)
+    # A closed stdout (e.g. piped into head) drops progress lines instead of
+    # aborting the run, so the wordlist file is still written in full
+    logging.raiseExceptions = False
+    
     generator = EnhancedWordlistGenerator()
     
     if args.quick:
         # Quick mode with sensible defaults
-        print("[*] Quick mode enabled with sensible defaults")
+        logger.info("[*] Quick mode enabled with sensible defaults")
         
         data = {
             'personal_info': {},
@@ -947,6 +1394,7 @@ Examples:
             'keywords': [],
             'leet_enabled': args.leet > 1,
             'leet_level': args.leet,
+            'space_rule_enabled': args.space_rule,
             'numbers_enabled': True,
             'number_types': ['1', '2', '3'],
             'number_ranges': [(0, 99), (1950, 2024)],
@@ -973,10 +1421,14 @@ Examples:
     else:
         # Interactive mode
         data = generator.get_user_input()
+        if args.space_rule:
+            data['space_rule_enabled'] = True
+    
+    data['workers'] = max(1, args.workers)
     
-    print(f"\n{'='*70}")
-    print(" GENERATION PARAMETERS")
-    print(f"{'='*70}")
+    logger.info(f"\n{'='*70}")
+    logger.info(" GENERATION PARAMETERS")
+    logger.info(f"{'='*70}")
     
     # Show key parameters
     for key, value in data.items():
@@ -985,31 +1437,32 @@ Examples:
                 display = ', '.join(str(v) for v in value[:3])
                 if len(value) > 3:
                     display += f'... ({len(value)} items)'
-                print(f"  {key:20}: {display}")
+                logger.info(f"  {key:20}: {display}")
             else:
-                print(f"  {key:20}: {value}")
+                logger.info(f"  {key:20}: {value}")
     
-    print(f"{'='*70}\n")
+    logger.info(f"{'='*70}\n")
     
-    # Generate wordlist
+    # Generate wordlist (a stream of unique passwords)
     wordlist = generator.generate(data)
     
-    print(f"\n{'='*70}")
-    print(" GENERATION COMPLETE")
-    print(f"{'='*70}")
-    print(f" Total passwords generated: {len(wordlist):,}")
+    # Save, drawing a random sample from the stream on its way to the writer
+    output_file = args.output
+    sample = []
+    total = generator.save_wordlist(_reservoir_tap(wordlist, 15, sample), output_file,
+                                    args.sort or data.get('sort_output', False))
     
-    if wordlist:
-        print("\n[*] Sample of generated passwords:")
-        sample = random.sample(list(wordlist), min(15, len(wordlist)))
+    if sample:
+        logger.info("\n[*] Sample of generated passwords:")
         for i, word in enumerate(sample):
-            print(f"  {i+1:2}. {word}")
-    
-    # Save
-    output_file = args.output
-    generator.save_wordlist(wordlist, output_file)
+            logger.info(f"  {i+1:2}. {word}")
     
-    print(f"\n[*] Wordlist saved to: {os.path.abspath(output_file)}")
+    if total is not None:
+        logger.info(f"\n{'='*70}")
+        logger.info(" GENERATION COMPLETE")
+        logger.info(f"{'='*70}")
+        logger.info(f" Total passwords generated: {total:,}")
+        logger.info(f"\n[*] Wordlist saved to: {os.path.abspath(output_file)}")
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -12,10 +12,78 @@ import re
 import itertools
 import random
 import string
-from typing import Set, Dict, List, Tuple
+import multiprocessing
+from typing import Set, Dict, List, Tuple, Optional, Iterable
 from collections import defaultdict
 
+# Only do common substitutions in simple leet
+SIMPLE_LEET = [
+    ('a', '4'), ('e', '3'), ('i', '1'), ('o', '0'),
+    ('s', '5'), ('t', '7'), ('l', '1')
+]
+
+# One translate table per subset of SIMPLE_LEET (both cases), indexed by bitmask
+_SIMPLE_LEET_TABLES = [
+    str.maketrans({case: sub
+                   for bit, (char, sub) in enumerate(SIMPLE_LEET) if mask >> bit & 1
+                   for case in (char, char.upper())})
+    for mask in range(1 << len(SIMPLE_LEET))
+]
+
+
+def _fit(parts: List[str], shortest: int, longest: int, min_len: int, max_len: int) -> List[str]:
+    """Keep parts that can complete a base of shortest..longest chars to min_len..max_len"""
+    return [part for part in parts if shortest + len(part) <= max_len and longest + len(part) >= min_len]
+
+def _any_of_regex(needles: Iterable[str]) -> re.Pattern:
+    """Regex matching wherever any needle occurs
+    
+    A needle that contains a shorter needle can never be the only match, so it
+    is dropped: every 19xx/20xx year contains '19' or '20', which leaves just the
+    26 two-digit years in the common-years alternation.
+    """
+    needles = set(filter(None, needles))
+    minimal = sorted(n for n in needles if not any(o != n and o in n for o in needles))
+    return re.compile('|'.join(map(re.escape, minimal)))
+
+def _reservoir_sample(items: Iterable[str], k: int) -> List[str]:
+    """Pick k passwords at random in one pass, so the set isn't copied to a list first"""
+    reservoir = []
+    for i, item in enumerate(items):
+        if i < k:
+            reservoir.append(item)
+        else:
+            j = random.randrange(i + 1)
+            if j < k:
+                reservoir[j] = item
+    
+    # The first k kept their slots; shuffle so the sample isn't shown in set order
+    random.shuffle(reservoir)
+    return reservoir
+
+_WORD_ARGS = None  # (generator, words, years, numbers, specials, style, min_len, max_len), set by _init_word_worker
+
+def _init_word_worker(*shared):
+    """Pool initializer: build one generator per worker and receive the shared lists once"""
+    global _WORD_ARGS
+    _WORD_ARGS = (HumanPasswordGenerator(),) + shared
+
+def _expand_shard(variant_list: List[Dict[str, str]]) -> str:
+    """Pool worker: filtered passwords for a shard of words, newline-joined"""
+    generator, words, years, numbers, specials, style, min_len, max_len = _WORD_ARGS
+    passwords = generator.expand_words(variant_list, words, years, numbers, specials, style,
+                                       min_len, max_len)
+    # Filtering here means only the survivors are pickled back, and the parent never rescans them
+    return '\n'.join(generator.filter_passwords(passwords, min_len, max_len))
+
 class HumanPasswordGenerator:
+    # Fewer words than this are generated serially; a pool costs more than it saves
+    MIN_PARALLEL_WORDS = 10
+    
+    # Specials that count towards "unrealistic" runs in filter_passwords
+    FILTER_SPECIALS = '!@#$%^&*'
+    _RE_REJECT = re.compile(r'[!@#$%^&*]{3,}|\d{7,}')
+    
     def __init__(self):
         # Common human password patterns
         self.pattern_templates = [
@@ -73,6 +141,10 @@ class HumanPasswordGenerator:
              '13', '14', '15', '16', '17', '18', '19',
              '20', '21', '22', '23', '24']
         
+        # One alternation per needle list so analyze_patterns scans each password once
+        self._years_re = _any_of_regex(self.common_years)
+        self._numbers_re = _any_of_regex(self.common_numbers)
+        
         # Leet substitutions humans actually use
         self.leet_map = {
             'a': ['4', '@'],
@@ -154,11 +226,24 @@ class HumanPasswordGenerator:
         
         return {k: v for k, v in data.items() if v is not None and v != []}
     
-    def create_natural_passwords(self, data: Dict) -> Set[str]:
-        """Create passwords a human would actually make"""
-        passwords = set()
+    def create_natural_passwords(self, data: Dict, min_len: int = 0,
+                                 max_len: int = sys.maxsize) -> Set[str]:
+        """Create passwords a human would actually make (skipping affixes that can't fit the length bounds)"""
+        prepared = self.prepare_inputs(data)
+        if prepared is None:
+            return set()
         
-        # Collect base words
+        words, variant_list, years, numbers, specials, style = prepared
+        passwords = self.expand_words(variant_list, words, years, numbers, specials, style,
+                                      min_len, max_len)
+        
+        # Add completely random common passwords
+        passwords.update(self.generate_common_passwords(words, years, numbers, specials))
+        
+        return passwords
+    
+    def collect_words(self, data: Dict) -> List[str]:
+        """Collect base words"""
         words = []
         if data.get('first_name'):
             words.append(data['first_name'])
@@ -169,8 +254,17 @@ class HumanPasswordGenerator:
         if data.get('keywords'):
             words.extend(data['keywords'])
         
+        return words
+    
+    def prepare_inputs(self, data: Dict) -> Optional[Tuple]:
+        """Collect words, years, numbers and specials, and each word's case/leet variants
+        
+        All random choices are made here, in word order, so expanding the words
+        serially or across worker processes gives the same passwords.
+        """
+        words = self.collect_words(data)
         if not words:
-            return passwords
+            return None
         
         # Get years
         years = []
@@ -198,124 +292,135 @@ class HumanPasswordGenerator:
         
         style = data.get('style', '4')
         
-        # Generate passwords based on style
+        # Basic word variations, each case form computed once per word
+        variant_list = []
         for word in words:
-            # Basic word variations
-            word_variations = [word]
-            word_variations.append(word.title())
-            word_variations.append(word.upper())
+            variants = {'word': word, 'title': word.title(), 'upper': word.upper()}
             
             # Add leet variations if enabled
             if data.get('use_leet'):
                 leet_word = self.apply_simple_leet(word)
                 if leet_word != word:
-                    word_variations.append(leet_word)
-                    word_variations.append(leet_word.title())
+                    variants['leet'] = leet_word
+                    variants['leet_title'] = leet_word.title()
             
-            # Style 1: Simple patterns (most common)
-            if style in ['1', '4']:
-                for w in word_variations:
-                    # Word + Year
-                    for year in years[:5]:  # Limit to 5 years
-                        passwords.add(f"{w}{year}")
-                        passwords.add(f"{year}{w}")
-                    
-                    # Word + Common number
-                    for num in numbers[:5]:
-                        passwords.add(f"{w}{num}")
-                        if len(num) <= 3:  # Short numbers more common
-                            passwords.add(f"{num}{w}")
+            variant_list.append(variants)
+        
+        return words, variant_list, years, numbers, specials, style
+    
+    def expand_words(self, variant_list: List[Dict[str, str]], words: List[str],
+                     years: List[str], numbers: List[str], specials: List[str], style: str,
+                     min_len: int = 0, max_len: int = sys.maxsize) -> Set[str]:
+        """Expand each word's variants into passwords for the chosen style"""
+        passwords = set()
+        
+        # Slices shared by every word, taken once instead of per variation
+        years5, years3 = years[:5], years[:3]
+        numbers5, numbers3 = numbers[:5], numbers[:3]
+        short_numbers = [num for num in numbers5 if len(num) <= 3]  # Short numbers more common
+        separators = [special for special in specials[:3] if special]  # Don't add empty separator twice
+        pair_separators = [special for special in specials[:2] if special]
+        sep_short = min(map(len, separators), default=0)
+        sep_long = max(map(len, separators), default=0)
+        pair_sep_short = min(map(len, pair_separators), default=0)
+        pair_sep_long = max(map(len, pair_separators), default=0)
+        
+        # Styles 1 and 2 flattened into word + suffix and prefix + word tables,
+        # joined once here instead of once per word
+        suffixes = []
+        prefixes = []
+        if style in ['1', '4']:
+            # Word + Year, Word + Common number; Year + Word, short Number + Word
+            suffixes += years5 + numbers5
+            prefixes += years5 + short_numbers
+        if style in ['2', '4']:
+            # Word + Special + Number, Word + Special + Year
+            suffixes += [special + num for special in separators for num in numbers3]
+            suffixes += [special + year for special in separators for year in years3]
+        
+        # Generate passwords based on style
+        for variants in variant_list:
+            word = variants['word']
+            word_variations = list(variants.values())
+            shortest = min(map(len, word_variations))
+            longest = max(map(len, word_variations))
+            
+            # Styles 1 and 2: affixed words
+            passwords.update(map(''.join, itertools.product(
+                word_variations, _fit(suffixes, shortest, longest, min_len, max_len))))
+            passwords.update(map(''.join, itertools.product(
+                _fit(prefixes, shortest, longest, min_len, max_len), word_variations)))
             
-            # Style 2: With separators
+            # Style 2: Special + Word + Number wraps the word, so it keeps its own product
             if style in ['2', '4']:
-                for w in word_variations:
-                    for special in specials[:3]:  # Most common specials
-                        # Word + Special + Number
-                        for num in numbers[:3]:
-                            if special:  # Don't add empty separator twice
-                                passwords.add(f"{w}{special}{num}")
-                                passwords.add(f"{special}{w}{num}")
-                        
-                        # Word + Special + Year
-                        for year in years[:3]:
-                            if special:
-                                passwords.add(f"{w}{special}{year}")
+                passwords.update(map(''.join, itertools.product(
+                    separators, word_variations,
+                    _fit(numbers3, shortest + sep_short, longest + sep_long, min_len, max_len))))
             
             # Style 3: Creative combinations
             if style in ['3', '4']:
-                # Combine with other words
-                for w1 in word_variations:
-                    for w2 in words:
-                        if w2 != word:  # Don't combine with self
-                            # Simple combinations
-                            passwords.add(f"{w1}{w2}")
-                            passwords.add(f"{w1.title()}{w2}")
-                            
-                            # With specials
-                            for special in specials[:2]:
-                                if special:
-                                    passwords.add(f"{w1}{special}{w2}")
-                            
-                            # Common phrases
-                            if w2 in ['love', 'god', 'life', 'you']:
-                                passwords.add(f"ilove{w1}")
-                                passwords.add(f"{w1}{w2}")
+                # Combine with other words (don't combine with self)
+                others = [w2 for w2 in words if w2 != word]
+                titled_variations = [w.title() for w in word_variations]
+                shortest_pair = min(shortest, min(map(len, titled_variations)))
+                longest_pair = max(longest, max(map(len, titled_variations)))
+                
+                # Simple combinations
+                fit_others = _fit(others, shortest_pair, longest_pair, min_len, max_len)
+                passwords.update(map(''.join, itertools.product(word_variations, fit_others)))
+                passwords.update(map(''.join, itertools.product(titled_variations, fit_others)))
+                
+                # With specials
+                passwords.update(map(''.join, itertools.product(
+                    word_variations, pair_separators,
+                    _fit(others, shortest + pair_sep_short, longest + pair_sep_long, min_len, max_len))))
+                
+                # Common phrases
+                if any(w2 in ['love', 'god', 'life', 'you'] for w2 in others):
+                    passwords.update('ilove' + w1 for w1 in word_variations)
             
             # Add some common password patterns
-            passwords.update(self.get_common_patterns(word))
-        
-        # Add completely random common passwords
-        passwords.update(self.generate_common_passwords(words, years, numbers, specials))
+            passwords.update(self.get_common_patterns(variants))
         
         return passwords
     
     def apply_simple_leet(self, word: str) -> str:
         """Apply leet substitutions humans actually use"""
-        leet_word = word
-        
-        # Only do common substitutions
-        substitutions = [
-            ('a', '4'), ('e', '3'), ('i', '1'), ('o', '0'),
-            ('s', '5'), ('t', '7'), ('l', '1')
-        ]
-        
         # 30% chance to apply leet
         if random.random() < 0.3:
-            for char, sub in substitutions:
-                if char in leet_word.lower():
-                    # Only substitute some occurrences, not all
-                    if random.random() < 0.5:
-                        leet_word = leet_word.replace(char, sub)
-                        leet_word = leet_word.replace(char.upper(), sub)
-        
-        return leet_word
-    
-    def get_common_patterns(self, word: str) -> Set[str]:
-        """Get common password patterns for a word"""
-        patterns = set()
-        
-        # Very common patterns
-        patterns.add(f"{word}123")
-        patterns.add(f"{word}1234")
-        patterns.add(f"{word}!")
-        patterns.add(f"{word}!!")
-        patterns.add(f"{word}?")
+            lowered = word.lower()
+            present = 0
+            for bit, (char, sub) in enumerate(SIMPLE_LEET):
+                if char in lowered:
+                    present |= 1 << bit
+            
+            # Only substitute some occurrences, not all: one fair bit per substitution
+            mask = present & random.getrandbits(len(SIMPLE_LEET)) if present else 0
+            if mask:
+                return word.translate(_SIMPLE_LEET_TABLES[mask])
         
-        patterns.add(f"{word.title()}123")
-        patterns.add(f"{word.title()}!")
+        return word
+    
+    def get_common_patterns(self, variants: Dict[str, str]) -> List[str]:
+        """Get common password patterns for a word's precomputed case variants"""
+        word = variants['word']
+        title = variants['title']
+        
+        # Very common patterns, built as one list literal (caller merges into its own set)
+        patterns = [
+            word + '123', word + '1234', word + '!', word + '!!', word + '?',
+            title + '123', title + '!',
+        ]
         
         # Common sports patterns
         if len(word) <= 5:
-            patterns.add(f"{word}88")
-            patterns.add(f"{word}99")
+            patterns += [word + '88', word + '99']
         
         return patterns
     
     def generate_common_passwords(self, words: List[str], years: List[str], 
                                  numbers: List[str], specials: List[str]) -> Set[str]:
         """Generate completely common passwords"""
-        common = set()
-        
         # Top common passwords (always include)
         top_passwords = [
             'password', '123456', '12345678', '123456789',
@@ -325,50 +430,55 @@ class HumanPasswordGenerator:
             'baseball', 'superman', 'mustang', 'michael'
         ]
         
-        common.update(top_passwords)
+        # Kept in insertion order, with a set sidecar for dedup, so the
+        # [:10]/[:5] slices below are stable and need no set -> list copy
+        common = list(top_passwords)
+        seen = set(common)
+        
+        def add(pwd: str) -> None:
+            if pwd not in seen:
+                seen.add(pwd)
+                common.append(pwd)
         
         # Add year variations to common words
-        for pwd in list(common):
+        for pwd in common[:]:
             for year in years[:3]:
-                common.add(f"{pwd}{year}")
-                common.add(f"{year}{pwd}")
+                add(f"{pwd}{year}")
+                add(f"{year}{pwd}")
         
         # Add some number patterns
-        for pwd in list(common)[:10]:
+        for pwd in common[:10]:
             for num in ['123', '1234', '1', '2', '99', '88']:
-                common.add(f"{pwd}{num}")
+                add(f"{pwd}{num}")
         
         # Add special character variations
-        for pwd in list(common)[:5]:
+        for pwd in common[:5]:
             for special in specials[:2]:
                 if special:
-                    common.add(f"{pwd}{special}")
-                    common.add(f"{special}{pwd}")
+                    add(f"{pwd}{special}")
+                    add(f"{special}{pwd}")
         
-        return common
+        return seen
     
     def filter_passwords(self, passwords: Set[str], min_len: int = 6, 
                         max_len: int = 20) -> Set[str]:
         """Filter passwords by length and remove unrealistic ones"""
         filtered = set()
+        reject = self._RE_REJECT.search
         
         for pwd in passwords:
             # Length check
             if min_len <= len(pwd) <= max_len:
-                # Remove passwords with too many specials in a row
-                if re.search(r'[!@#$%^&*]{3,}', pwd):
-                    continue
-                
-                # Remove passwords with too many numbers in a row (more than 6)
-                if re.search(r'\d{7,}', pwd):
-                    continue
-                
                 # Remove passwords that are just numbers
                 if pwd.isdigit():
                     continue
                 
                 # Remove passwords that are just specials
-                if all(c in '!@#$%^&*' for c in pwd):
+                if not pwd.strip(self.FILTER_SPECIALS):
+                    continue
+                
+                # Remove too many specials or numbers (more than 6) in a row
+                if reject(pwd):
                     continue
                 
                 filtered.add(pwd)
@@ -384,7 +494,7 @@ class HumanPasswordGenerator:
         print(" PASSWORD PATTERN ANALYSIS")
         print("="*60)
         
-        sample = random.sample(list(passwords), min(50, len(passwords)))
+        sample = _reservoir_sample(passwords, 50)
         
         # Categorize patterns
         categories = {
@@ -398,15 +508,15 @@ class HumanPasswordGenerator:
         
         for pwd in sample:
             # Check patterns
-            if any(year in pwd for year in self.common_years if year):
+            if self._years_re.search(pwd):
                 categories['name_year'] += 1
             
-            if any(num in pwd for num in self.common_numbers):
+            has_number = self._numbers_re.search(pwd)
+            if has_number:
                 categories['name_number'] += 1
             
-            if any(spec in pwd for spec in self.common_specials):
-                if any(num in pwd for num in self.common_numbers):
-                    categories['name_special_number'] += 1
+            if has_number and any(spec in pwd for spec in self.common_specials):
+                categories['name_special_number'] += 1
             
             if pwd.lower() in ['password', 'qwerty', 'admin', 'welcome']:
                 categories['common_words'] += 1
@@ -431,19 +541,50 @@ class HumanPasswordGenerator:
         """Main generation function"""
         print("\n[*] Generating human-like passwords...")
         
-        # Generate natural passwords
-        passwords = self.create_natural_passwords(data)
+        min_len = 6
+        max_len = 20
+        workers = data.get('workers', 1)
+        
+        if workers > 1 and len(self.collect_words(data)) >= self.MIN_PARALLEL_WORDS:
+            filtered = self.generate_parallel(self.prepare_inputs(data), min_len, max_len, workers)
+            print(f"[+] After filtering: {len(filtered):,} passwords")
+            return filtered
+        
+        # Generate natural passwords (combinations that can't reach min_len..max_len are never built)
+        passwords = self.create_natural_passwords(data, min_len, max_len)
         
         print(f"[+] Initial generation: {len(passwords):,} passwords")
         
         # Filter unrealistic ones
-        min_len = 6
-        max_len = 20
         filtered = self.filter_passwords(passwords, min_len, max_len)
         
         print(f"[+] After filtering: {len(filtered):,} passwords")
         
         return filtered
+    
+    def generate_parallel(self, prepared: Tuple, min_len: int, max_len: int,
+                          workers: int) -> Set[str]:
+        """Expand and filter word shards in worker processes, then merge"""
+        words, variant_list, years, numbers, specials, style = prepared
+        print(f"[*] Expanding {len(words)} words across {workers} workers...")
+        
+        # About four shards per worker so a slow shard doesn't leave the others idle
+        shard_size = max(1, len(variant_list) // (workers * 4))
+        shards = [variant_list[i:i + shard_size] for i in range(0, len(variant_list), shard_size)]
+        
+        filtered = set()
+        with multiprocessing.Pool(workers, initializer=_init_word_worker,
+                                  initargs=(words, years, numbers, specials, style,
+                                            min_len, max_len)) as pool:
+            for blob in pool.imap_unordered(_expand_shard, shards):
+                if blob:
+                    filtered.update(blob.split('\n'))
+        
+        # Add completely random common passwords
+        common = self.generate_common_passwords(words, years, numbers, specials)
+        filtered.update(self.filter_passwords(common, min_len, max_len))
+        
+        return filtered
 
 def main():
     parser = argparse.ArgumentParser(
@@ -478,6 +619,8 @@ Examples:
                        help='Output filename')
     parser.add_argument('--max-passwords', type=int, default=5000,
                        help='Maximum number of passwords to generate')
+    parser.add_argument('--workers', type=int, default=1,
+                       help='Worker processes for expanding and filtering words (default: 1)')
     
     args = parser.parse_args()
     
@@ -531,6 +674,8 @@ Examples:
         use_leet = input("Use leet speak? (y/n): ").strip().lower()
         data['use_leet'] = use_leet == 'y'
     
+    data['workers'] = max(1, args.workers)
+    
     # Generate passwords
     passwords = generator.generate(data)
     
@@ -546,16 +691,19 @@ Examples:
     if passwords:
         print(f"\n[*] Saving to {args.output}...")
         
-        # Sort passwords by length and similarity
-        sorted_passwords = sorted(passwords, key=lambda x: (len(x), x))
+        # Sort passwords by length and similarity: a plain sort, then a stable
+        # sort on length gives (len, pwd) order without a per-item tuple key
+        sorted_passwords = sorted(passwords)
+        sorted_passwords.sort(key=len)
         
         with open(args.output, 'w', encoding='utf-8') as f:
             f.write(f"# Human-like passwords generated on {datetime.now().strftime('%Y-%m-%d')}\n")
             f.write(f"# Total: {len(sorted_passwords)}\n")
             f.write("#" * 50 + "\n\n")
             
-            for pwd in sorted_passwords:
-                f.write(pwd + '\n')
+            # One buffered write for the whole body instead of one per password
+            f.write('\n'.join(sorted_passwords))
+            f.write('\n')
         
         file_size = os.path.getsize(args.output)
         print(f"[+] Saved {len(sorted_passwords):,} passwords")
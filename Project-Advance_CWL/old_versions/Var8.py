@@ -126,6 +126,11 @@ class IndianPasswordGenerator:
             'ch': ['6h', 'ch']
         }
         
+        # Level-2 leet: single-char keys and their first two subs, sliced once
+        self._leet_level2 = {char: tuple(subs[:2]) for char, subs in self.indian_leet.items()
+                             if len(char) == 1}
+        self._leet_level2_chars = frozenset(self._leet_level2)
+        
         # Common Indian password patterns analysis
         self.common_patterns = [
             # Name + Year
@@ -530,11 +535,10 @@ class IndianPasswordGenerator:
                     variations.add(word.replace(char, sub))
         
         elif level == 2:
-            # Moderate: Indian common leet
-            for char, subs in self.indian_leet.items():
-                if len(char) == 1 and char in word:
-                    for sub in subs[:2]:
-                        variations.add(word.replace(char, sub))
+            # Moderate: Indian common leet (only the leet chars the word contains)
+            for char in self._leet_level2_chars.intersection(word):
+                for sub in self._leet_level2[char]:
+                    variations.add(word.replace(char, sub))
         
         elif level == 3:
             # Advanced: Multiple substitutions